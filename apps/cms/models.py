@@ -1,12 +1,53 @@
 """Models for CMS app."""
 
+import threading
 from typing import ClassVar
 
+import markdown
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
 
+CMS_HTML_CACHE_PREFIX = "cms_page_html:v1"
+CMS_HTML_CACHE_TIMEOUT = 3600  # 1 hour
+
+CONTENT_MARKDOWN_EXTENSIONS = [
+    "extra",  # Tables, fenced code, footnotes, etc.
+    "codehilite",  # Syntax highlighting
+    "toc",  # Table of contents
+    "nl2br",  # Newlines to <br>
+    "tables",  # Table support
+]
+HERO_SUBTITLE_MARKDOWN_EXTENSIONS = ["nl2br"]
+# Columns only needed to render HTML; views can defer() them (see get_rendered_html)
+MARKDOWN_SOURCE_FIELDS = frozenset({"content", "hero_subtitle"})
+
+# Markdown instances are stateful, so each thread keeps its own pair
+_markdown_local = threading.local()
+
+
+def _get_markdown(name: str, extensions: list[str]) -> markdown.Markdown:
+    """Return this thread's reusable Markdown converter, reset for a new document.
+
+    Building a Markdown instance loads every extension, which costs more than
+    converting a typical page, so converters are created once per thread.
+
+    Args:
+        name: Attribute name the converter is stored under.
+        extensions: Extensions to load when the converter is first created.
+
+    Returns:
+        A reset Markdown instance ready for convert().
+
+    """
+    md = getattr(_markdown_local, name, None)
+    if md is None:
+        md = markdown.Markdown(extensions=extensions)
+        setattr(_markdown_local, name, md)
+    return md.reset()
+
 
 class Page(models.Model):
     """Dynamic CMS page with markdown content and optional hero/cards sections.
@@ -237,3 +278,40 @@ class Page(models.Model):
 
         """
         return self.hero_title or self.title
+
+    def get_rendered_html(self) -> dict[str, str]:
+        """Render the Markdown content and hero subtitle to HTML (cached).
+
+        The cache key includes ``updated_at``, so saving the page makes the
+        next view render it afresh; old entries simply expire.
+
+        Returns:
+            Dictionary with content_html and hero_subtitle_html keys.
+
+        """
+        if self.pk is None:
+            return self._render_html()
+        key = f"{CMS_HTML_CACHE_PREFIX}:{self.pk}:{self.updated_at.timestamp()}"
+        return cache.get_or_set(key, self._render_html, CMS_HTML_CACHE_TIMEOUT)
+
+    def _render_html(self) -> dict[str, str]:
+        """Render the Markdown content and hero subtitle to HTML.
+
+        Returns:
+            Dictionary with content_html and hero_subtitle_html keys.
+
+        """
+        # Views defer the Markdown sources since cache hits never read them;
+        # load both in one query on a miss
+        deferred = self.get_deferred_fields() & MARKDOWN_SOURCE_FIELDS
+        if deferred:
+            self.refresh_from_db(fields=sorted(deferred))
+        content_html = ""
+        if self.content:
+            content_html = _get_markdown("content", CONTENT_MARKDOWN_EXTENSIONS).convert(self.content)
+        hero_subtitle_html = ""
+        if self.hero_subtitle:
+            hero_subtitle_html = _get_markdown("hero_subtitle", HERO_SUBTITLE_MARKDOWN_EXTENSIONS).convert(
+                self.hero_subtitle
+            )
+        return {"content_html": content_html, "hero_subtitle_html": hero_subtitle_html}
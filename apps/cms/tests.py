@@ -0,0 +1,52 @@
+"""Tests for CMS pages."""
+
+import pytest
+
+from apps.cms.models import Page
+
+
+@pytest.mark.django_db
+def test_rendered_html_is_cached_until_the_page_is_saved(monkeypatch) -> None:
+    page = Page.objects.create(slug="about", title="About", content="# Hello", hero_subtitle="Line one")
+
+    html = page.get_rendered_html()
+    assert "Hello</h1>" in html["content_html"]
+    assert html["hero_subtitle_html"] == "<p>Line one</p>"
+
+    # A second view of the same revision does not re-render the Markdown
+    monkeypatch.setattr("apps.cms.models._get_markdown", lambda *a, **kw: pytest.fail("re-rendered"))
+    assert Page.objects.get(pk=page.pk).get_rendered_html() == html
+    monkeypatch.undo()
+
+    page.content = "# Updated"
+    page.save()
+    assert "Updated</h1>" in Page.objects.get(pk=page.pk).get_rendered_html()["content_html"]
+
+
+@pytest.mark.django_db
+def test_deferred_markdown_sources_load_only_on_cache_miss(django_assert_num_queries) -> None:
+    from django.core.cache import cache
+
+    from apps.cms.models import MARKDOWN_SOURCE_FIELDS
+
+    cache.clear()
+    Page.objects.create(slug="home", title="Home", content="Body", hero_subtitle="Sub")
+
+    page = Page.objects.defer(*MARKDOWN_SOURCE_FIELDS).get(slug="home")
+    with django_assert_num_queries(1):
+        assert page.get_rendered_html()["content_html"] == "<p>Body</p>"
+
+    page = Page.objects.defer(*MARKDOWN_SOURCE_FIELDS).get(slug="home")
+    with django_assert_num_queries(0):
+        assert page.get_rendered_html()["hero_subtitle_html"] == "<p>Sub</p>"
+
+
+def test_markdown_converters_are_reused_and_reset() -> None:
+    from apps.cms.models import CONTENT_MARKDOWN_EXTENSIONS, _get_markdown
+
+    md = _get_markdown("content", CONTENT_MARKDOWN_EXTENSIONS)
+    assert md.convert("# Intro") == '<h1 id="intro">Intro</h1>'
+    # Same instance; reset() leaves no state behind that would alter the output
+    again = _get_markdown("content", CONTENT_MARKDOWN_EXTENSIONS)
+    assert again is md
+    assert again.convert("# Intro") == '<h1 id="intro">Intro</h1>'
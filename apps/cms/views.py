@@ -1,7 +1,6 @@
 """Views for CMS app."""
 
 import logfire
-import markdown
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
@@ -9,7 +8,7 @@ from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 
 from apps.cms.forms import PageForm
-from apps.cms.models import Page
+from apps.cms.models import MARKDOWN_SOURCE_FIELDS, Page
 
 
 def page_detail(request: HttpRequest, slug: str) -> HttpResponse:
@@ -27,7 +26,7 @@ def page_detail(request: HttpRequest, slug: str) -> HttpResponse:
 
     """
     try:
-        page = Page.objects.get(slug=slug)
+        page = Page.objects.defer(*MARKDOWN_SOURCE_FIELDS).get(slug=slug)
     except Page.DoesNotExist:
         logfire.warning("CMS page not found", slug=slug)
         raise Http404("Page not found") from None
@@ -67,28 +66,6 @@ def page_detail(request: HttpRequest, slug: str) -> HttpResponse:
             )
             raise Http404("Page not found")
 
-    # Render markdown content
-    content_html = ""
-    if page.content:
-        content_html = markdown.markdown(
-            page.content,
-            extensions=[
-                "extra",  # Tables, fenced code, footnotes, etc.
-                "codehilite",  # Syntax highlighting
-                "toc",  # Table of contents
-                "nl2br",  # Newlines to <br>
-                "tables",  # Table support
-            ],
-        )
-
-    # Render hero subtitle if present
-    hero_subtitle_html = ""
-    if page.hero_subtitle:
-        hero_subtitle_html = markdown.markdown(
-            page.hero_subtitle,
-            extensions=["nl2br"],
-        )
-
     logfire.info(
         "CMS page viewed",
         slug=slug,
@@ -98,8 +75,7 @@ def page_detail(request: HttpRequest, slug: str) -> HttpResponse:
 
     context = {
         "page": page,
-        "content_html": content_html,
-        "hero_subtitle_html": hero_subtitle_html,
+        **page.get_rendered_html(),
     }
     return render(request, "cms/page_detail.html", context)
 
@@ -1,21 +1,164 @@
 """Django admin configuration for ZwiftPower models."""
 
-from typing import Any, ClassVar
+import json
+import re
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, ClassVar
 
+from django.apps import apps
 from django.contrib import admin, messages
-from django.http import HttpRequest, HttpResponseRedirect
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import IntegerField
+from django.db.models.functions import Cast, Floor
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.tasks import TaskResultStatus  # ty:ignore[unresolved-import]
 from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from simple_history.admin import SimpleHistoryAdmin
 
 from apps.zwiftpower.models import ZPEvent, ZPRiderResults, ZPTeamRiders
 from apps.zwiftpower.tasks import update_team_results, update_team_riders
 
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+ESTIMATED_COUNT_CACHE_TIMEOUT = 60  # 1 minute
+SYNC_DEDUP_WINDOW = timedelta(minutes=5)
+
+
+def _enqueue_unless_pending(task: Any) -> bool:
+    """Enqueue a sync task unless a run is already queued or running.
+
+    Runs enqueued more than ``SYNC_DEDUP_WINDOW`` ago are ignored so a task
+    orphaned by a dead worker can't block syncing forever.
+
+    Args:
+        task: The django-tasks task to enqueue.
+
+    Returns:
+        True if the task was enqueued, False if a pending run already exists.
+
+    """
+    DBTaskResult = apps.get_model("django_tasks_database", "DBTaskResult")
+    pending = DBTaskResult.objects.filter(
+        task_path=task.module_path,
+        status__in=[TaskResultStatus.READY, TaskResultStatus.RUNNING],
+        enqueued_at__gte=timezone.now() - SYNC_DEDUP_WINDOW,
+    ).exists()
+    if pending:
+        return False
+    task.enqueue()
+    return True
+
+
+def _sync_response(
+    model_admin: admin.ModelAdmin, request: HttpRequest, task: Any, label: str, changelist: str
+) -> HttpResponse:
+    """Enqueue a sync task and report the outcome.
+
+    HTMX requests (the changelist sync buttons) get a 204 with a ``showToast``
+    HX-Trigger, so the changelist isn't re-rendered. Plain requests get a
+    flash message and a redirect back to the changelist.
+
+    Args:
+        model_admin: The admin handling the request.
+        request: The HTTP request.
+        task: The django-tasks task to enqueue.
+        label: Human-readable name of the sync for the message.
+        changelist: URL name of the changelist to redirect to.
+
+    Returns:
+        Empty 204 response for HTMX, otherwise a redirect to the changelist.
+
+    """
+    if _enqueue_unless_pending(task):
+        message, level = f"{label} task has been queued.", messages.SUCCESS
+    else:
+        message, level = f"{label} is already queued or running.", messages.WARNING
+
+    if request.headers.get("HX-Request"):
+        response = HttpResponse(status=204)
+        response["HX-Trigger"] = json.dumps({
+            "showToast": [{"message": message, "tags": messages.DEFAULT_TAGS[level]}],
+        })
+        return response
+
+    model_admin.message_user(request, message, level)
+    return HttpResponseRedirect(reverse(changelist))
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids a full ``COUNT(*)`` on unfiltered changelists.
+
+    On PostgreSQL the planner's row estimate (``pg_class.reltuples``) is used
+    for the unfiltered changelist and cached briefly. Filtered or searched
+    changelists, other databases, and never-analyzed tables fall back to the
+    exact count.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        """Return the (possibly estimated) total number of objects.
+
+        Returns:
+            Row estimate for an unfiltered queryset on PostgreSQL, otherwise the exact count.
+
+        """
+        query = getattr(self.object_list, "query", None)
+        if connection.vendor != "postgresql" or query is None or query.where:
+            return super().count
+
+        table = self.object_list.model._meta.db_table
+        cache_key = f"admin_estimated_count:{table}"
+        estimate = cache.get(cache_key)
+        if estimate is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+                row = cursor.fetchone()
+            estimate = row[0] if row else -1
+            cache.set(cache_key, estimate, ESTIMATED_COUNT_CACHE_TIMEOUT)
+
+        # reltuples is -1 until the table has been vacuumed/analyzed
+        if estimate < 0:
+            return super().count
+        return estimate
+
+
+class ChangelistOnlyFieldsMixin:
+    """Load only ``changelist_only_fields`` on the changelist page.
+
+    The change form still loads full rows, so editing never triggers
+    deferred-field queries.
+    """
+
+    changelist_only_fields: ClassVar[list[str]] = []
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Narrow the SELECT to the changelist columns when listing.
+
+        Returns:
+            The admin queryset, restricted with ``only()`` on the changelist.
+
+        """
+        qs = super().get_queryset(request)  # ty:ignore[unresolved-attribute]
+        match = getattr(request, "resolver_match", None)
+        opts = self.model._meta  # ty:ignore[unresolved-attribute]
+        if self.changelist_only_fields and match and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist":
+            qs = qs.only(*self.changelist_only_fields)
+        return qs
+
 
 @admin.register(ZPTeamRiders)
-class ZPTeamRidersAdmin(SimpleHistoryAdmin):
+class ZPTeamRidersAdmin(ChangelistOnlyFieldsMixin, SimpleHistoryAdmin):
     """Admin configuration for ZPTeamRiders model with history tracking."""
 
     change_list_template = "admin/zwiftpower/zpteamriders/change_list.html"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     list_display: ClassVar[list[str]] = [
         "name",
@@ -29,11 +172,25 @@ class ZPTeamRidersAdmin(SimpleHistoryAdmin):
         "date_created",
         "date_modified",
     ]
+    changelist_only_fields: ClassVar[list[str]] = [
+        "id",
+        "name",
+        "zwid",
+        "flag",
+        "div",
+        "ftp",
+        "weight",
+        "skill",
+        "date_left",
+        "date_created",
+        "date_modified",
+    ]
     list_filter: ClassVar[list[str]] = ["div", "date_left", "date_created", "date_modified"]
     search_fields: ClassVar[list[str]] = ["name", "zwid", "aid"]
     ordering: ClassVar[list[str]] = ["name"]
     readonly_fields: ClassVar[list[str]] = ["date_created", "date_modified"]
     actions: ClassVar[list[str]] = ["run_update_team_riders"]
+    history_list_display: ClassVar[list[str]] = ["div", "ftp", "weight", "skill"]
 
     fieldsets: ClassVar[list[tuple[str | None, dict[str, Any]]]] = [
         (None, {"fields": ["zwid", "aid", "name", "flag", "age"]}),
@@ -63,30 +220,24 @@ class ZPTeamRidersAdmin(SimpleHistoryAdmin):
         ]
         return custom_urls + urls
 
-    def sync_from_zwiftpower(self, request: HttpRequest) -> HttpResponseRedirect:
+    def sync_from_zwiftpower(self, request: HttpRequest) -> HttpResponse:
         """Handle the sync button click.
 
         Returns:
-            Redirect to the changelist page.
+            Empty 204 for HTMX requests, otherwise a redirect to the changelist page.
 
         """
-        update_team_riders.enqueue()
-        self.message_user(
-            request,
-            "Sync from ZwiftPower task has been queued.",
-            messages.SUCCESS,
+        return _sync_response(
+            self, request, update_team_riders, "Sync from ZwiftPower", "admin:zwiftpower_zpteamriders_changelist"
         )
-        return HttpResponseRedirect(reverse("admin:zwiftpower_zpteamriders_changelist"))
 
     @admin.action(description="Update team riders from ZwiftPower")
     def run_update_team_riders(self, request: HttpRequest, queryset: Any) -> None:
         """Enqueue the update_team_riders background task."""
-        update_team_riders.enqueue()
-        self.message_user(
-            request,
-            "Update team riders task has been queued.",
-            messages.SUCCESS,
-        )
+        if _enqueue_unless_pending(update_team_riders):
+            self.message_user(request, "Update team riders task has been queued.", messages.SUCCESS)
+        else:
+            self.message_user(request, "Update team riders is already queued or running.", messages.WARNING)
 
 
 @admin.register(ZPEvent)
@@ -106,6 +257,7 @@ class ZPEventAdmin(admin.ModelAdmin):
     ordering: ClassVar[list[str]] = ["-event_date"]
     readonly_fields: ClassVar[list[str]] = ["date_created", "date_modified"]
     date_hierarchy = "event_date"
+    actions: ClassVar[list[str]] = ["run_update_team_results"]
 
     fieldsets: ClassVar[list[tuple[str | None, dict[str, Any]]]] = [
         (None, {"fields": ["zid", "title", "event_date"]}),
@@ -143,27 +295,41 @@ class ZPEventAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def sync_team_results(self, request: HttpRequest) -> HttpResponseRedirect:
+    def sync_team_results(self, request: HttpRequest) -> HttpResponse:
         """Handle the sync button click.
 
         Returns:
-            Redirect to the changelist page.
+            Empty 204 for HTMX requests, otherwise a redirect to the changelist page.
 
         """
-        update_team_results.enqueue()
-        self.message_user(
+        return _sync_response(
+            self,
             request,
-            "Sync team results from ZwiftPower task has been queued.",
-            messages.SUCCESS,
+            update_team_results,
+            "Sync team results from ZwiftPower",
+            "admin:zwiftpower_zpevent_changelist",
         )
-        return HttpResponseRedirect(reverse("admin:zwiftpower_zpevent_changelist"))
+
+    @admin.action(description="Update team results from ZwiftPower")
+    def run_update_team_results(self, request: HttpRequest, queryset: Any) -> None:
+        """Enqueue one update_team_results task, however many events are selected.
+
+        The ZwiftPower team_results API returns every event in one response,
+        so a single run refreshes all of them.
+        """
+        if _enqueue_unless_pending(update_team_results):
+            self.message_user(request, "Update team results task has been queued.", messages.SUCCESS)
+        else:
+            self.message_user(request, "Update team results is already queued or running.", messages.WARNING)
 
 
 @admin.register(ZPRiderResults)
-class ZPRiderResultsAdmin(admin.ModelAdmin):
+class ZPRiderResultsAdmin(ChangelistOnlyFieldsMixin, admin.ModelAdmin):
     """Admin configuration for ZPRiderResults model."""
 
     change_list_template = "admin/zwiftpower/zpriderresults/change_list.html"
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
     list_display: ClassVar[list[str]] = [
         "name",
@@ -177,10 +343,26 @@ class ZPRiderResultsAdmin(admin.ModelAdmin):
         "weight",
         "height",
     ]
+    changelist_only_fields: ClassVar[list[str]] = [
+        "id",
+        "event",
+        "event__zid",
+        "event__title",
+        "event__event_date",
+        "name",
+        "category",
+        "pos",
+        "position_in_cat",
+        "time_seconds",
+        "avg_wkg",
+        "avg_power",
+        "weight",
+        "height",
+    ]
     list_filter: ClassVar[list[str]] = ["category", "event__event_date", "tname"]
     search_fields: ClassVar[list[str]] = ["name", "zwid", "event__title"]
     ordering: ClassVar[list[str]] = ["-event__event_date", "pos"]
-    readonly_fields: ClassVar[list[str]] = ["date_created", "date_modified"]
+    readonly_fields: ClassVar[list[str]] = ["res_id", "date_created", "date_modified"]
     raw_id_fields: ClassVar[list[str]] = ["event"]
     list_select_related: ClassVar[list[str]] = ["event"]
 
@@ -206,6 +388,15 @@ class ZPRiderResultsAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ["date_created", "date_modified"]}),
     ]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Annotate whole finish seconds so ``time_display`` skips Decimal math.
+
+        Returns:
+            The admin queryset annotated with ``time_int``.
+
+        """
+        return super().get_queryset(request).annotate(time_int=Cast(Floor("time_seconds"), IntegerField()))
+
     def time_display(self, obj: ZPRiderResults) -> str:
         """Format time as mm:ss.
 
@@ -213,14 +404,29 @@ class ZPRiderResultsAdmin(admin.ModelAdmin):
             Formatted time string.
 
         """
-        if obj.time_seconds is None:
+        if obj.time_int is None:  # ty:ignore[unresolved-attribute]
             return "-"
-        total_seconds = int(obj.time_seconds)
-        minutes, seconds = divmod(total_seconds, 60)
+        minutes, seconds = divmod(obj.time_int, 60)  # ty:ignore[unresolved-attribute]
         return f"{minutes}:{seconds:02d}"
 
     time_display.short_description = "Time"  # type: ignore[attr-defined]
 
+    def get_search_results(self, request: HttpRequest, queryset: QuerySet, search_term: str) -> tuple[QuerySet, bool]:
+        """Search the GIN-indexed ``search_vector`` on PostgreSQL.
+
+        Each word in the search term becomes a prefix match, so partial names
+        still work. Other databases use the default ``search_fields`` lookup.
+
+        Returns:
+            Tuple of (filtered queryset, whether results may contain duplicates).
+
+        """
+        terms = re.findall(r"\w+", search_term)
+        if connection.vendor != "postgresql" or not terms:
+            return super().get_search_results(request, queryset, search_term)
+        query = SearchQuery(" & ".join(f"{term}:*" for term in terms), config="simple", search_type="raw")
+        return queryset.filter(search_vector=query), False
+
     def get_urls(self) -> list:
         """Add custom URLs for sync action.
 
@@ -238,17 +444,17 @@ class ZPRiderResultsAdmin(admin.ModelAdmin):
         ]
         return custom_urls + urls
 
-    def sync_team_results(self, request: HttpRequest) -> HttpResponseRedirect:
+    def sync_team_results(self, request: HttpRequest) -> HttpResponse:
         """Handle the sync button click.
 
         Returns:
-            Redirect to the changelist page.
+            Empty 204 for HTMX requests, otherwise a redirect to the changelist page.
 
         """
-        update_team_results.enqueue()
-        self.message_user(
+        return _sync_response(
+            self,
             request,
-            "Sync team results from ZwiftPower task has been queued.",
-            messages.SUCCESS,
+            update_team_results,
+            "Sync team results from ZwiftPower",
+            "admin:zwiftpower_zpriderresults_changelist",
         )
-        return HttpResponseRedirect(reverse("admin:zwiftpower_zpriderresults_changelist"))
@@ -0,0 +1,68 @@
+"""Add a trigger-maintained, GIN-indexed full-text search column to ZPRiderResults."""
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_SQL = """
+CREATE INDEX zwiftpower_zpriderresults_search_gin
+    ON zwiftpower_zpriderresults USING gin (search_vector);
+
+CREATE FUNCTION zwiftpower_zpriderresults_search_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector(
+        'simple',
+        coalesce(NEW.name, '') || ' ' || NEW.zwid::text || ' ' ||
+        coalesce((SELECT title FROM zwiftpower_zpevent WHERE id = NEW.event_id), '')
+    );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER zwiftpower_zpriderresults_search_trigger
+    BEFORE INSERT OR UPDATE OF name, zwid, event_id ON zwiftpower_zpriderresults
+    FOR EACH ROW EXECUTE FUNCTION zwiftpower_zpriderresults_search_update();
+
+UPDATE zwiftpower_zpriderresults r
+    SET search_vector = to_tsvector('simple', r.name || ' ' || r.zwid::text || ' ' || e.title)
+    FROM zwiftpower_zpevent e
+    WHERE r.event_id = e.id;
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS zwiftpower_zpriderresults_search_trigger ON zwiftpower_zpriderresults;
+DROP FUNCTION IF EXISTS zwiftpower_zpriderresults_search_update();
+DROP INDEX IF EXISTS zwiftpower_zpriderresults_search_gin;
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    """Create the GIN index, trigger and backfill search vectors.
+
+    PostgreSQL only. On SQLite (local dev / tests) the column exists but is
+    never populated, and the admin falls back to the default ILIKE search.
+    """
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SQL)
+
+
+def drop_search_trigger(apps, schema_editor):
+    """Drop the trigger, function and GIN index (PostgreSQL only)."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+    """Add ZPRiderResults.search_vector with a PostgreSQL trigger and GIN index."""
+
+    dependencies = [
+        ("zwiftpower", "0002_historicalzpteamriders"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zpriderresults",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, reverse_code=drop_search_trigger),
+    ]
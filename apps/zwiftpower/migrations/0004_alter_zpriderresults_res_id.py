@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 10:02
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zwiftpower', '0003_zpriderresults_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='zpriderresults',
+            name='res_id',
+        ),
+        migrations.AddField(
+            model_name='zpriderresults',
+            name='res_id',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('zid', models.Value('.'), 'pos'), help_text='Result ID (zid.pos)', output_field=models.CharField(max_length=50)),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('zwiftpower', '0004_alter_zpriderresults_res_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='zpriderresults',
+            index=models.Index(fields=['zwid'], name='zp_result_zwid_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+"""Refresh ZPRiderResults.search_vector when a ZPEvent title changes.
+
+The results trigger from 0003 only fires when a result row is written, but the
+vector also contains the event title; this trigger re-indexes an event's
+results when its title is renamed (including via bulk upsert ON CONFLICT).
+"""
+
+from django.db import migrations
+
+CREATE_SQL = """
+CREATE FUNCTION zwiftpower_zpevent_title_search_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE zwiftpower_zpriderresults
+        SET search_vector = to_tsvector(
+            'simple', coalesce(name, '') || ' ' || zwid::text || ' ' || coalesce(NEW.title, '')
+        )
+        WHERE event_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER zwiftpower_zpevent_title_search_trigger
+    AFTER UPDATE OF title ON zwiftpower_zpevent
+    FOR EACH ROW
+    WHEN (OLD.title IS DISTINCT FROM NEW.title)
+    EXECUTE FUNCTION zwiftpower_zpevent_title_search_update();
+"""
+
+DROP_SQL = """
+DROP TRIGGER IF EXISTS zwiftpower_zpevent_title_search_trigger ON zwiftpower_zpevent;
+DROP FUNCTION IF EXISTS zwiftpower_zpevent_title_search_update();
+"""
+
+
+def create_title_trigger(apps, schema_editor):
+    """Create the event title trigger (PostgreSQL only)."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_SQL)
+
+
+def drop_title_trigger(apps, schema_editor):
+    """Drop the event title trigger and function (PostgreSQL only)."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SQL)
+
+
+class Migration(migrations.Migration):
+    """Keep result search vectors in sync with ZPEvent.title."""
+
+    dependencies = [
+        ("zwiftpower", "0005_zpriderresults_zp_result_zwid_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_trigger, reverse_code=drop_title_trigger),
+    ]
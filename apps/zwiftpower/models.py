@@ -1,10 +1,15 @@
 """Models for ZwiftPower data."""
 
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Concat
 from simple_history.models import HistoricalRecords
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class ZPTeamRiders(models.Model):
     """ZwiftPower team member data from the team admin API.
@@ -131,49 +136,57 @@ class ZPTeamRiders(models.Model):
             del self.skip_history_when_saving
 
     @classmethod
-    def get_field_history(cls, zwid: int, field: str) -> list[tuple]:
+    def get_field_history(cls, zwid: int, field: str, limit: int | None = 100) -> Iterator[tuple]:
         """Get history of a specific field for a rider.
 
+        Rows are streamed rather than materialized.
+
         Args:
             zwid: Zwift rider ID.
             field: Field name to get history for.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, value) tuples, newest first.
+            Iterator of (date, value) tuples, newest first.
 
         """
-        return list(
+        qs = (
             cls.history.filter(zwid=zwid)
             .exclude(**{f"{field}__isnull": True})
             .order_by("-history_date")
             .values_list("history_date", field)
         )
+        if limit is not None:
+            qs = qs[:limit]
+        return qs.iterator(chunk_size=500)
 
     @classmethod
-    def get_weight_history(cls, zwid: int) -> list[tuple]:
+    def get_weight_history(cls, zwid: int, limit: int | None = 100) -> Iterator[tuple]:
         """Get weight history for a rider.
 
         Args:
             zwid: Zwift rider ID.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, weight) tuples, newest first.
+            Iterator of (date, weight) tuples, newest first.
 
         """
-        return cls.get_field_history(zwid, "weight")
+        return cls.get_field_history(zwid, "weight", limit)
 
     @classmethod
-    def get_ftp_history(cls, zwid: int) -> list[tuple]:
+    def get_ftp_history(cls, zwid: int, limit: int | None = 100) -> Iterator[tuple]:
         """Get FTP history for a rider.
 
         Args:
             zwid: Zwift rider ID.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, ftp) tuples, newest first.
+            Iterator of (date, ftp) tuples, newest first.
 
         """
-        return cls.get_field_history(zwid, "ftp")
+        return cls.get_field_history(zwid, "ftp", limit)
 
 
 class ZPEvent(models.Model):
@@ -226,7 +239,12 @@ class ZPRiderResults(models.Model):
     # Identifiers
     zid = models.PositiveIntegerField(help_text="ZwiftPower event ID")
     zwid = models.PositiveIntegerField(help_text="Zwift rider ID")
-    res_id = models.CharField(max_length=50, blank=True, help_text="Result ID (zid.pos)")
+    res_id = models.GeneratedField(
+        expression=Concat("zid", models.Value("."), "pos"),
+        output_field=models.CharField(max_length=50),
+        db_persist=True,
+        help_text="Result ID (zid.pos)",
+    )
 
     # Rider info
     name = models.CharField(max_length=255, help_text="Rider display name")
@@ -305,6 +323,10 @@ class ZPRiderResults(models.Model):
     # Event type
     f_t = models.CharField(max_length=50, blank=True, help_text="Event type (TYPE_RACE, TYPE_RIDE)")
 
+    # Full-text search (PostgreSQL only). Maintained by a database trigger from
+    # name, zwid and the event title; GIN-indexed. See migration 0003.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # Timestamps
     date_created = models.DateTimeField(auto_now_add=True)
     date_modified = models.DateTimeField(auto_now=True)
@@ -318,33 +340,41 @@ class ZPRiderResults(models.Model):
         constraints: ClassVar[list] = [
             models.UniqueConstraint(fields=["zid", "zwid"], name="unique_zid_zwid"),
         ]
+        indexes: ClassVar[list] = [
+            # Per-rider lookups (profile recent results, get_weight_height_history);
+            # zid lookups use unique_zid_zwid
+            models.Index(fields=["zwid"], name="zp_result_zwid_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return string representation of result.
 
+        Uses the event title only when the event is already loaded
+        (``select_related``); otherwise falls back to the ZP event ID rather
+        than issuing a query.
+
         Returns:
-            Rider name, event title, and position.
+            Rider name, event title (or ID), and position.
 
         """
-        return f"{self.name} - {self.event.title} (P{self.pos})"
+        event = self.event.title if ZPRiderResults.event.is_cached(self) else f"event {self.zid}"
+        return f"{self.name} - {event} (P{self.pos})"
 
     @classmethod
-    def get_weight_height_history(cls, zwid: int) -> list[tuple]:
+    def get_weight_height_history(cls, zwid: int) -> Iterator[tuple]:
         """Get weight and height history for a rider ordered by date (newest first).
 
         Args:
             zwid: The Zwift rider ID.
 
         Returns:
-            List of tuples (event_date, weight, height) ordered newest to oldest.
+            Iterator of tuples (event_date, weight, height) ordered newest to oldest.
             Only includes records where weight or height is not None.
 
         """
-        results = (
-            cls.objects.filter(zwid=zwid)
-            .exclude(weight__isnull=True, height__isnull=True)
-            .select_related("event")
+        return (
+            cls.objects.filter(models.Q(weight__isnull=False) | models.Q(height__isnull=False), zwid=zwid)
             .order_by("-event__event_date")
             .values_list("event__event_date", "weight", "height")
+            .iterator(chunk_size=200)
         )
-        return list(results)
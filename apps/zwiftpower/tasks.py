@@ -4,16 +4,218 @@ Uses Django 6.0 background tasks feature with django-tasks database backend.
 """
 
 import html
+import re
 from datetime import UTC, datetime
 from decimal import Decimal, InvalidOperation
+from math import isfinite
 
 import logfire
+from django.db import connection, transaction
 from django.tasks import task  # ty:ignore[unresolved-import]
 from django.utils import timezone
+from psycopg import sql
 
 from apps.zwiftpower.models import ZPEvent, ZPRiderResults, ZPTeamRiders
 from apps.zwiftpower.zp_client import ZPClient
 
+# Columns overwritten by update_team_riders when a rider already exists
+RIDER_UPDATE_FIELDS: list[str] = [
+    "aid",
+    "name",
+    "flag",
+    "age",
+    "div",
+    "divw",
+    "r",
+    "rank",
+    "ftp",
+    "weight",
+    "skill",
+    "skill_race",
+    "skill_seg",
+    "skill_power",
+    "distance",
+    "climbed",
+    "energy",
+    "time",
+    "h_1200_watts",
+    "h_1200_wkg",
+    "h_15_watts",
+    "h_15_wkg",
+    "status",
+    "reg",
+    "email",
+    "zada",
+    "date_left",
+    "date_modified",
+]
+
+# Columns overwritten by update_team_results when a (zid, zwid) result already exists
+RESULT_UPDATE_FIELDS: list[str] = [
+    "event",
+    "name",
+    "flag",
+    "age",
+    "male",
+    "tid",
+    "tname",
+    "pos",
+    "position_in_cat",
+    "category",
+    "label",
+    "time_seconds",
+    "time_gun",
+    "gap",
+    "ftp",
+    "weight",
+    "height",
+    "avg_power",
+    "avg_wkg",
+    "np",
+    "wftp",
+    "wkg_ftp",
+    "w5",
+    "w15",
+    "w30",
+    "w60",
+    "w120",
+    "w300",
+    "w1200",
+    "wkg5",
+    "wkg15",
+    "wkg30",
+    "wkg60",
+    "wkg120",
+    "wkg300",
+    "wkg1200",
+    "avg_hr",
+    "max_hr",
+    "hrm",
+    "div",
+    "divw",
+    "skill",
+    "skill_gain",
+    "zada",
+    "reg",
+    "penalty",
+    "upg",
+    "f_t",
+    "date_modified",
+]
+
+# Field maps for update_team_results, (model field, JSON key, ...). The int
+# and decimal parsers also unwrap ZP's [value, comparison_value] pairs.
+
+# (field, key) parsed with _parse_positive_small_int
+RESULT_INT_FIELDS: tuple[tuple[str, str], ...] = (
+    ("pos", "pos"),
+    ("position_in_cat", "position_in_cat"),
+    ("ftp", "ftp"),
+    ("height", "height"),
+    ("avg_power", "avg_power"),
+    ("np", "np"),
+    ("wftp", "wftp"),
+    ("w5", "w5"),
+    ("w15", "w15"),
+    ("w30", "w30"),
+    ("w60", "w60"),
+    ("w120", "w120"),
+    ("w300", "w300"),
+    ("w1200", "w1200"),
+    ("avg_hr", "avg_hr"),
+    ("max_hr", "max_hr"),
+)
+
+# (field, key) validated with _numeric_str
+RESULT_DECIMAL_FIELDS: tuple[tuple[str, str], ...] = (
+    ("time_seconds", "time"),
+    ("time_gun", "time_gun"),
+    ("gap", "gap"),
+    ("weight", "weight"),
+    ("avg_wkg", "avg_wkg"),
+    ("wkg_ftp", "wkg_ftp"),
+    ("wkg5", "wkg5"),
+    ("wkg15", "wkg15"),
+    ("wkg30", "wkg30"),
+    ("wkg60", "wkg60"),
+    ("wkg120", "wkg120"),
+    ("wkg300", "wkg300"),
+    ("wkg1200", "wkg1200"),
+    ("skill", "skill"),
+    ("skill_gain", "skill_gain"),
+)
+
+# (field, key) stored as-is, "" when missing
+RESULT_STR_FIELDS: tuple[tuple[str, str], ...] = (
+    ("flag", "flag"),
+    ("age", "age"),
+    ("category", "category"),
+    ("label", "label"),
+    ("penalty", "penalty"),
+)
+
+# (field, key, default) coerced with bool()
+RESULT_BOOL_FIELDS: tuple[tuple[str, str, int], ...] = (
+    ("male", "male", 1),
+    ("hrm", "hrm", 0),
+    ("reg", "reg", 0),
+    ("upg", "upg", 0),
+)
+
+# (field, key) stored as-is, 0 when missing
+RESULT_NUMBER_FIELDS: tuple[tuple[str, str], ...] = (
+    ("div", "div"),
+    ("divw", "divw"),
+    ("zada", "zada"),
+)
+
+# Above this many result rows on Postgres, upsert through COPY + a staging
+# table instead of bulk_create's parameterised INSERTs
+COPY_UPSERT_THRESHOLD = 5000
+
+
+def _copy_upsert_results(objs: list[ZPRiderResults]) -> None:
+    """Upsert rider results on Postgres by COPYing into a temp staging table.
+
+    Streams the rows with ``COPY ... FROM STDIN`` and merges them with a single
+    ``INSERT ... SELECT ... ON CONFLICT (zid, zwid) DO UPDATE``. This avoids the
+    per-parameter binding cost of ``bulk_create`` on large syncs.
+
+    Args:
+        objs: Unsaved ZPRiderResults instances, unique on (zid, zwid).
+
+    """
+    meta = ZPRiderResults._meta
+    fields = [meta.get_field(name) for name in ["zid", "zwid", "date_created", *RESULT_UPDATE_FIELDS]]
+    identifiers = {
+        "table": sql.Identifier(meta.db_table),
+        "staging": sql.Identifier("zp_results_staging"),
+        "columns": sql.SQL(", ").join(sql.Identifier(f.column) for f in fields),
+        "updates": sql.SQL(", ").join(
+            sql.SQL("{column} = EXCLUDED.{column}").format(column=sql.Identifier(f.column))
+            for f in fields
+            if f.name in RESULT_UPDATE_FIELDS
+        ),
+    }
+
+    now = timezone.now()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            sql.SQL("CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA").format(
+                **identifiers
+            )
+        )
+        with cursor.copy(sql.SQL("COPY {staging} ({columns}) FROM STDIN").format(**identifiers)) as copy:
+            for obj in objs:
+                obj.date_created = obj.date_modified = now
+                copy.write_row([f.get_db_prep_save(getattr(obj, f.attname), connection) for f in fields])
+        cursor.execute(
+            sql.SQL(
+                "INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} "
+                "ON CONFLICT (zid, zwid) DO UPDATE SET {updates}"
+            ).format(**identifiers)
+        )
+
 
 def _clean_str(value: object) -> str:
     """Normalize a string from the ZP API.
@@ -38,18 +240,59 @@ def _clean_str(value: object) -> str:
 def _parse_decimal(value: str | int | float | None) -> Decimal | None:
     """Parse a value to Decimal, returning None if invalid.
 
+    Strings (the common case in ZP payloads) and ints go straight to the
+    Decimal constructor; only floats take the ``str()`` detour, which keeps
+    their shortest repr (``71.3``) instead of the binary expansion
+    ``Decimal(71.3)`` would produce.
+
     Returns:
         Decimal value or None if parsing fails.
 
     """
-    if value is None or value == "" or value == 0:
+    if not value:
         return None
+    value_type = type(value)
+    if value_type is str or value_type is int:
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return None
     try:
         return Decimal(str(value))
     except (InvalidOperation, ValueError):
         return None
 
 
+NUMERIC_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)\s*")
+
+
+def _numeric_str(value: list | str | int | float | None) -> str | int | None:
+    """Validate a value for a DecimalField without building a Decimal.
+
+    Used on the bulk result path: DecimalField converts the value once when
+    the row is written, so parsing it to Decimal here would do the work twice.
+    ZP ``[value, comparison_value]`` pairs are unwrapped here too, saving an
+    ``_extract_first_value`` call per value.
+
+    Returns:
+        The value (str/int, floats as their repr) or None if it isn't a finite number.
+
+    """
+    value_type = type(value)
+    if value_type is list:
+        value = value[0] if value else None
+        value_type = type(value)
+    if not value:
+        return None
+    if value_type is str:
+        return value if NUMERIC_RE.fullmatch(value) else None
+    if value_type is int:
+        return value
+    if value_type is float and isfinite(value):
+        return repr(value)
+    return None
+
+
 def _parse_int(value: str | int | None) -> int | None:
     """Parse a value to int, returning None if invalid.
 
@@ -65,6 +308,33 @@ def _parse_int(value: str | int | None) -> int | None:
         return None
 
 
+# Upper bound of PositiveSmallIntegerField (Postgres smallint)
+POSITIVE_SMALLINT_MAX = 32767
+
+
+def _parse_positive_small_int(value: list | str | int | None) -> int | None:
+    """Parse a power/HR/position value, dropping anything outside 0..32767.
+
+    Every integer column in ZPRiderResults is a PositiveSmallIntegerField; a
+    single out-of-range spike from ZP would otherwise fail the CHECK (or
+    overflow smallint) and abort the whole bulk upsert. ZP
+    ``[value, comparison_value]`` pairs are unwrapped to their first element.
+
+    Returns:
+        int value, or None if parsing fails or the value is out of range.
+
+    """
+    if type(value) is list:
+        value = value[0] if value else None
+    if not value:
+        return None
+    try:
+        parsed = int(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed if 0 <= parsed <= POSITIVE_SMALLINT_MAX else None
+
+
 def _extract_first_value(value: list | str | int | None) -> str | int | None:
     """Extract first value from array or return value as-is.
 
@@ -72,7 +342,7 @@ def _extract_first_value(value: list | str | int | None) -> str | int | None:
         First element if value is a list, otherwise the value itself.
 
     """
-    if isinstance(value, list) and len(value) > 0:
+    if type(value) is list and value:
         return value[0]
     return value  # ty:ignore[invalid-return-type]
 
@@ -85,96 +355,138 @@ def update_team_riders() -> dict:
     - Updates existing riders with the latest data
     - Sets date_left for riders no longer on the team
 
+    Returns:
+        dict with counts of created, updated, and left riders.
+
+    """
+    with ZPClient() as client:
+        riders_data = client.fetch_team_riders()
+    return _sync_team_riders(riders_data)
+
+
+def _sync_team_riders(riders_data: list[dict]) -> dict:
+    """Create/update ZPTeamRiders from a team_riders payload and mark leavers.
+
+    Args:
+        riders_data: The ``data`` list from the team_riders API.
+
     Returns:
         dict with counts of created, updated, and left riders.
 
     """
     with logfire.span("update_team_riders"):
-        created_count = 0
-        updated_count = 0
         left_count = 0
 
-        with ZPClient() as client:
-            riders_data = client.fetch_team_riders()
-
         if not riders_data:
             logfire.warning("No riders data returned from ZwiftPower")
             return {"created": 0, "updated": 0, "left": 0, "error": "No data returned"}
 
-        # Track which zwids are in the current roster
-        current_zwids = set()
+        # Zwids in the current roster; anyone else still marked active has left
+        current_zwids = {zwid for rider in riders_data if (zwid := rider.get("zwid"))}
 
-        for rider in riders_data:
-            zwid = rider.get("zwid")
-            if not zwid:
-                continue
+        with transaction.atomic():
+            # One SELECT for every rider we already know about; used for the
+            # created/updated counts and the tracked-field history diff.
+            existing = {r.zwid: r for r in ZPTeamRiders.objects.all()}
+            upserts: dict[int, ZPTeamRiders] = {}
+            tracked_changed: dict[int, ZPTeamRiders] = {}
 
-            current_zwids.add(zwid)
-
-            # Extract and parse values
-            ftp_raw = _extract_first_value(rider.get("ftp"))
-            weight_raw = _extract_first_value(rider.get("w"))
-
-            defaults = {
-                "aid": str(rider.get("aid", "") or ""),
-                "name": _clean_str(rider.get("name")),
-                "flag": rider.get("flag", ""),
-                "age": rider.get("age", ""),
-                "div": rider.get("div", 0) or 0,
-                "divw": rider.get("divw", 0) or 0,
-                "r": str(rider.get("r", "") or ""),
-                "rank": _parse_decimal(rider.get("rank")),
-                "ftp": _parse_int(ftp_raw),
-                "weight": _parse_decimal(weight_raw),
-                "skill": rider.get("skill", 0) or 0,
-                "skill_race": rider.get("skill_race", 0) or 0,
-                "skill_seg": rider.get("skill_seg", 0) or 0,
-                "skill_power": rider.get("skill_power", 0) or 0,
-                "distance": rider.get("distance", 0) or 0,
-                "climbed": rider.get("climbed", 0) or 0,
-                "energy": rider.get("energy", 0) or 0,
-                "time": rider.get("time", 0) or 0,
-                "h_1200_watts": _parse_int(rider.get("h_1200_watts")),
-                "h_1200_wkg": _parse_decimal(rider.get("h_1200_wkg")),
-                "h_15_watts": _parse_int(rider.get("h_15_watts")),
-                "h_15_wkg": _parse_decimal(rider.get("h_15_wkg")),
-                "status": rider.get("status", ""),
-                "reg": bool(rider.get("reg", 0)),
-                "email": rider.get("email", ""),
-                "zada": rider.get("zada", 0) or 0,
-                "date_left": None,  # Clear date_left if rider is back on team
-            }
-
-            obj, created = ZPTeamRiders.objects.update_or_create(
-                zwid=zwid,
-                defaults=defaults,
-            )
+            for rider in riders_data:
+                zwid = rider.get("zwid")
+                if not zwid:
+                    continue
 
+                # Extract and parse values
+                ftp_raw = _extract_first_value(rider.get("ftp"))
+                weight_raw = _extract_first_value(rider.get("w"))
+
+                defaults = {
+                    "aid": str(rider.get("aid", "") or ""),
+                    "name": _clean_str(rider.get("name")),
+                    "flag": rider.get("flag", ""),
+                    "age": rider.get("age", ""),
+                    "div": rider.get("div", 0) or 0,
+                    "divw": rider.get("divw", 0) or 0,
+                    "r": str(rider.get("r", "") or ""),
+                    "rank": _parse_decimal(rider.get("rank")),
+                    "ftp": _parse_int(ftp_raw),
+                    "weight": _parse_decimal(weight_raw),
+                    "skill": rider.get("skill", 0) or 0,
+                    "skill_race": rider.get("skill_race", 0) or 0,
+                    "skill_seg": rider.get("skill_seg", 0) or 0,
+                    "skill_power": rider.get("skill_power", 0) or 0,
+                    "distance": rider.get("distance", 0) or 0,
+                    "climbed": rider.get("climbed", 0) or 0,
+                    "energy": rider.get("energy", 0) or 0,
+                    "time": rider.get("time", 0) or 0,
+                    "h_1200_watts": _parse_int(rider.get("h_1200_watts")),
+                    "h_1200_wkg": _parse_decimal(rider.get("h_1200_wkg")),
+                    "h_15_watts": _parse_int(rider.get("h_15_watts")),
+                    "h_15_wkg": _parse_decimal(rider.get("h_15_wkg")),
+                    "status": rider.get("status", ""),
+                    "reg": bool(rider.get("reg", 0)),
+                    "email": rider.get("email", ""),
+                    "zada": rider.get("zada", 0) or 0,
+                    "date_left": None,  # Clear date_left if rider is back on team
+                }
+
+                upserts[zwid] = ZPTeamRiders(zwid=zwid, **defaults)
+
+                # Only changes to tracked fields get a history row (see ZPTeamRiders.save)
+                obj = existing.get(zwid)
+                if obj is not None and any(getattr(obj, f) != defaults[f] for f in ZPTeamRiders.TRACKED_FIELDS):
+                    for field, value in defaults.items():
+                        setattr(obj, field, value)
+                    tracked_changed[zwid] = obj
+
+            # Single INSERT ... ON CONFLICT (zwid) DO UPDATE per batch. PKs are
+            # set on the inserted objects, so their history rows can follow.
+            ZPTeamRiders.objects.bulk_create(
+                list(upserts.values()),
+                update_conflicts=True,
+                unique_fields=["zwid"],
+                update_fields=RIDER_UPDATE_FIELDS,
+                batch_size=1000,
+            )
+            created = [obj for zwid, obj in upserts.items() if zwid not in existing]
             if created:
-                created_count += 1
-                logfire.info(f"Created rider: {obj.name} ({zwid})")
-            else:
-                updated_count += 1
-
-        # Mark riders who are no longer on the team
-        left_riders = ZPTeamRiders.objects.filter(
-            date_left__isnull=True,
-        ).exclude(
-            zwid__in=current_zwids,
-        )
-
-        for rider in left_riders:
-            rider.date_left = timezone.now()
-            rider.save(update_fields=["date_left"])
-            left_count += 1
-            logfire.info(f"Rider left team: {rider.name} ({rider.zwid})")
+                ZPTeamRiders.history.bulk_history_create(created, batch_size=500)
+            if tracked_changed:
+                ZPTeamRiders.history.bulk_history_create(list(tracked_changed.values()), batch_size=500, update=True)
+
+            # Mark riders who are no longer on the team: one read for the
+            # notifications, one UPDATE for all of them
+            left_riders = list(
+                ZPTeamRiders.objects.filter(date_left__isnull=True)
+                .exclude(zwid__in=current_zwids)
+                .values_list("pk", "zwid", "name")
+            )
+            if left_riders:
+                left_count = ZPTeamRiders.objects.filter(pk__in=[pk for pk, _, _ in left_riders]).update(
+                    date_left=timezone.now()
+                )
+
+        created_count = len(created)
+        updated_count = len(upserts) - created_count
+
+        # One log line per batch rather than one per rider
+        if created:
+            logfire.info(
+                "Created {count} riders", count=created_count, riders=[(obj.name, obj.zwid) for obj in created]
+            )
+        if left_riders:
+            logfire.info(
+                "{count} riders left team",
+                count=len(left_riders),
+                riders=[(name, zwid) for _, zwid, name in left_riders],
+            )
 
-            # Enqueue notification task
-            from apps.accounts.tasks import notify_rider_left_team
+        from apps.accounts.tasks import notify_rider_left_team
 
+        for _, zwid, name in left_riders:
             notify_rider_left_team.enqueue(
-                zwid=rider.zwid,
-                rider_name=rider.name,
+                zwid=zwid,
+                rider_name=name,
                 source="ZwiftPower",
             )
 
@@ -200,15 +512,23 @@ def update_team_results() -> dict:
         dict with counts of events and results created/updated.
 
     """
-    with logfire.span("update_team_results"):
-        events_created = 0
-        events_updated = 0
-        results_created = 0
-        results_updated = 0
+    with ZPClient() as client:
+        data = client.fetch_team_results()
+    return _sync_team_results(data)
+
+
+def _sync_team_results(data: dict) -> dict:
+    """Upsert ZPEvent and ZPRiderResults rows from a team_results payload.
 
-        with ZPClient() as client:
-            data = client.fetch_team_results()
+    Args:
+        data: Dict with ``events`` and ``data``, as returned by ``ZPClient.fetch_team_results``.
 
+    Returns:
+        dict with counts of events and results created/updated.
+
+    """
+    # One transaction for the events and results writes, not one commit per statement
+    with logfire.span("update_team_results"), transaction.atomic():
         events_data = data.get("events", {})
         results_data = data.get("data", [])
 
@@ -216,28 +536,44 @@ def update_team_results() -> dict:
             logfire.warning("No team results data returned from ZwiftPower")
             return {"events_created": 0, "events_updated": 0, "results_created": 0, "results_updated": 0}
 
-        # First, create/update all events
-        event_cache: dict[int, ZPEvent] = {}
-        for zid_str, event_info in events_data.items():
-            zid = int(zid_str)
-            event_date = datetime.fromtimestamp(event_info.get("date", 0), tz=UTC)
-
-            event, created = ZPEvent.objects.update_or_create(
-                zid=zid,
-                defaults={
-                    "title": _clean_str(event_info.get("title")),
-                    "event_date": event_date,
-                },
+        # Upsert all events in one statement, then load them back keyed by zid
+        event_objs = [
+            ZPEvent(
+                zid=int(zid_str),
+                title=_clean_str(event_info.get("title")),
+                event_date=datetime.fromtimestamp(event_info.get("date", 0), tz=UTC),
             )
-            event_cache[zid] = event
-
-            if created:
-                events_created += 1
-                logfire.info(f"Created event: {event.title} ({zid})")
-            else:
-                events_updated += 1
-
-        # Now process rider results
+            for zid_str, event_info in events_data.items()
+        ]
+        event_zids = [e.zid for e in event_objs]
+        existing_event_zids = set(ZPEvent.objects.filter(zid__in=event_zids).values_list("zid", flat=True))
+        ZPEvent.objects.bulk_create(
+            event_objs,
+            update_conflicts=True,
+            unique_fields=["zid"],
+            update_fields=["title", "event_date", "date_modified"],
+        )
+        event_cache: dict[int, ZPEvent] = ZPEvent.objects.in_bulk(event_zids, field_name="zid")
+
+        new_events = [(e.title, e.zid) for e in event_objs if e.zid not in existing_event_zids]
+        if new_events:
+            logfire.info("Created {count} events", count=len(new_events), events=new_events)
+        events_updated = len(existing_event_zids)
+        events_created = len(event_objs) - events_updated
+
+        # Results may reference events missing from this response's events
+        # dict; load those that already exist in one query
+        result_zids = {int(r.get("zid", 0)) for r in results_data} - {0}
+        missing_zids = result_zids - event_cache.keys()
+        if missing_zids:
+            event_cache.update(ZPEvent.objects.in_bulk(missing_zids, field_name="zid"))
+
+        # Existing (zid, zwid) keys, for the created/updated counts
+        existing_keys = set(ZPRiderResults.objects.filter(zid__in=result_zids).values_list("zid", "zwid"))
+
+        # Pass 1: keep results whose event is known; the last one wins per (zid, zwid)
+        rows: dict[tuple[int, int], tuple[ZPEvent, dict]] = {}
+        unknown_zids: set[int] = set()
         for result in results_data:
             zid = int(result.get("zid", 0))
             zwid = result.get("zwid")
@@ -245,107 +581,60 @@ def update_team_results() -> dict:
             if not zid or not zwid:
                 continue
 
-            # Get or fetch the event
-            if zid not in event_cache:
-                event = ZPEvent.objects.filter(zid=zid).first()
-                if not event:
-                    logfire.warning(f"Event {zid} not found for result, skipping")
-                    continue
-                event_cache[zid] = event
-            else:
-                event = event_cache[zid]
-
-            # Extract values from arrays (ZP returns [value, comparison_value])
-            time_val = _extract_first_value(result.get("time"))
-            weight_val = _extract_first_value(result.get("weight"))
-            height_val = _extract_first_value(result.get("height"))
-            avg_power_val = _extract_first_value(result.get("avg_power"))
-            avg_wkg_val = _extract_first_value(result.get("avg_wkg"))
-            np_val = _extract_first_value(result.get("np"))
-            wftp_val = _extract_first_value(result.get("wftp"))
-            wkg_ftp_val = _extract_first_value(result.get("wkg_ftp"))
-            avg_hr_val = _extract_first_value(result.get("avg_hr"))
-            max_hr_val = _extract_first_value(result.get("max_hr"))
-
-            # Power curve values
-            w5_val = _extract_first_value(result.get("w5"))
-            w15_val = _extract_first_value(result.get("w15"))
-            w30_val = _extract_first_value(result.get("w30"))
-            w60_val = _extract_first_value(result.get("w60"))
-            w120_val = _extract_first_value(result.get("w120"))
-            w300_val = _extract_first_value(result.get("w300"))
-            w1200_val = _extract_first_value(result.get("w1200"))
-
-            wkg5_val = _extract_first_value(result.get("wkg5"))
-            wkg15_val = _extract_first_value(result.get("wkg15"))
-            wkg30_val = _extract_first_value(result.get("wkg30"))
-            wkg60_val = _extract_first_value(result.get("wkg60"))
-            wkg120_val = _extract_first_value(result.get("wkg120"))
-            wkg300_val = _extract_first_value(result.get("wkg300"))
-            wkg1200_val = _extract_first_value(result.get("wkg1200"))
-
-            defaults = {
-                "event": event,
-                "res_id": result.get("res_id", "") or "",
-                "name": _clean_str(result.get("name")),
-                "flag": result.get("flag", "") or "",
-                "age": result.get("age", "") or "",
-                "male": bool(result.get("male", 1)),
-                "tid": str(result.get("tid", "") or ""),
-                "tname": _clean_str(result.get("tname")),
-                "pos": _parse_int(result.get("pos")),
-                "position_in_cat": _parse_int(result.get("position_in_cat")),
-                "category": result.get("category", "") or "",
-                "label": result.get("label", "") or "",
-                "time_seconds": _parse_decimal(time_val),
-                "time_gun": _parse_decimal(result.get("time_gun")),
-                "gap": _parse_decimal(result.get("gap")),
-                "ftp": _parse_int(result.get("ftp")),
-                "weight": _parse_decimal(weight_val),
-                "height": _parse_int(height_val),
-                "avg_power": _parse_int(avg_power_val),
-                "avg_wkg": _parse_decimal(avg_wkg_val),
-                "np": _parse_int(np_val),
-                "wftp": _parse_int(wftp_val),
-                "wkg_ftp": _parse_decimal(wkg_ftp_val),
-                "w5": _parse_int(w5_val),
-                "w15": _parse_int(w15_val),
-                "w30": _parse_int(w30_val),
-                "w60": _parse_int(w60_val),
-                "w120": _parse_int(w120_val),
-                "w300": _parse_int(w300_val),
-                "w1200": _parse_int(w1200_val),
-                "wkg5": _parse_decimal(wkg5_val),
-                "wkg15": _parse_decimal(wkg15_val),
-                "wkg30": _parse_decimal(wkg30_val),
-                "wkg60": _parse_decimal(wkg60_val),
-                "wkg120": _parse_decimal(wkg120_val),
-                "wkg300": _parse_decimal(wkg300_val),
-                "wkg1200": _parse_decimal(wkg1200_val),
-                "avg_hr": _parse_int(avg_hr_val),
-                "max_hr": _parse_int(max_hr_val),
-                "hrm": bool(result.get("hrm", 0)),
-                "div": result.get("div", 0) or 0,
-                "divw": result.get("divw", 0) or 0,
-                "skill": _parse_decimal(result.get("skill")),
-                "skill_gain": _parse_decimal(result.get("skill_gain")),
-                "zada": result.get("zada", 0) or 0,
-                "reg": bool(result.get("reg", 0)),
-                "penalty": result.get("penalty", "") or "",
-                "upg": bool(result.get("upg", 0)),
-                "f_t": (result.get("f_t", "") or "").strip(),
-            }
-
-            _, created = ZPRiderResults.objects.update_or_create(
-                zid=zid,
-                zwid=zwid,
-                defaults=defaults,
+            event = event_cache.get(zid)
+            if event is None:
+                unknown_zids.add(zid)
+                continue
+
+            rows[zid, zwid] = (event, result)
+
+        if unknown_zids:
+            logfire.warning(
+                "Skipped results for {count} unknown events", count=len(unknown_zids), zids=sorted(unknown_zids)
             )
 
-            if created:
-                results_created += 1
-            else:
-                results_updated += 1
+        # Pass 2: parse column by column rather than building one dict per row.
+        # ZP returns many values as [value, comparison_value].
+        results = [result for _, result in rows.values()]
+        # Bind the helpers locally so each comprehension skips the global lookups.
+        # Decimal columns stay strings; DecimalField converts them on write.
+        pi, pd = _parse_positive_small_int, _numeric_str
+        columns = {
+            "event": [event for event, _ in rows.values()],
+            "name": [_clean_str(r.get("name")) for r in results],
+            "tname": [_clean_str(r.get("tname")) for r in results],
+            "tid": [str(r.get("tid") or "") for r in results],
+            "f_t": [(r.get("f_t") or "").strip() for r in results],
+        }
+        for field, key in RESULT_INT_FIELDS:
+            columns[field] = [pi(r.get(key)) for r in results]
+        for field, key in RESULT_DECIMAL_FIELDS:
+            columns[field] = [pd(r.get(key)) for r in results]
+        for field, key in RESULT_STR_FIELDS:
+            columns[field] = [r.get(key) or "" for r in results]
+        for field, key, default in RESULT_BOOL_FIELDS:
+            columns[field] = [bool(r.get(key, default)) for r in results]
+        for field, key in RESULT_NUMBER_FIELDS:
+            columns[field] = [r.get(key) or 0 for r in results]
+        field_names = list(columns)
+        result_objs = [
+            ZPRiderResults(zid=zid, zwid=zwid, **dict(zip(field_names, values, strict=True)))
+            for (zid, zwid), values in zip(rows, zip(*columns.values(), strict=True), strict=True)
+        ]
+
+        # Single INSERT ... ON CONFLICT (zid, zwid) DO UPDATE per batch
+        if connection.vendor == "postgresql" and len(result_objs) > COPY_UPSERT_THRESHOLD:
+            _copy_upsert_results(result_objs)
+        else:
+            ZPRiderResults.objects.bulk_create(
+                result_objs,
+                update_conflicts=True,
+                unique_fields=["zid", "zwid"],
+                update_fields=RESULT_UPDATE_FIELDS,
+                batch_size=1000,
+            )
+        results_updated = len(rows.keys() & existing_keys)
+        results_created = len(rows) - results_updated
 
         logfire.info(
             f"Team results update complete: {events_created} events created, {events_updated} events updated, "
@@ -358,3 +647,22 @@ def update_team_results() -> dict:
             "results_created": results_created,
             "results_updated": results_updated,
         }
+
+
+@task
+def update_team_all() -> dict:
+    """Fetch the team roster and results with one ZwiftPower login and update both.
+
+    The two API calls run concurrently on the shared session, so the HTTP
+    wall time is roughly the slower of the two rather than their sum.
+
+    Returns:
+        dict with the ``riders`` and ``results`` summaries.
+
+    """
+    with ZPClient() as client:
+        riders_data, results = client.fetch_team_data()
+    return {
+        "riders": _sync_team_riders(riders_data),
+        "results": _sync_team_results(results),
+    }
@@ -1,12 +1,13 @@
 """Smoke tests for ZwiftPower views."""
 
 from datetime import timedelta
+from decimal import Decimal
 
 import pytest
 from django.urls import reverse
 from django.utils import timezone
 
-from apps.zwiftpower.models import ZPEvent, ZPRiderResults
+from apps.zwiftpower.models import ZPEvent, ZPRiderResults, ZPTeamRiders
 
 
 @pytest.fixture
@@ -118,3 +119,315 @@ def test_results_show_plain_name_when_unlinked(auth_client, zp_result) -> None:
     # The tooltip partial wraps the name in a hover dropdown. With no linked user,
     # the dropdown wrapper should not appear around the result name cell.
     assert b"dropdown-hover" not in response.content
+
+
+@pytest.mark.django_db
+def test_rider_results_admin_changelist_renders(admin_client, zp_result) -> None:
+    """The changelist renders from the narrowed only() queryset."""
+    response = admin_client.get(reverse("admin:zwiftpower_zpriderresults_changelist"))
+    assert response.status_code == 200
+    assert b"Test Rider" in response.content
+    assert b"Friday Night Crit" in response.content
+
+
+@pytest.mark.django_db
+def test_rider_results_admin_change_form_renders(admin_client, zp_result) -> None:
+    response = admin_client.get(reverse("admin:zwiftpower_zpriderresults_change", args=[zp_result.pk]))
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_rider_results_admin_time_display(admin_client, zp_result) -> None:
+    """time_display formats the DB-side integer seconds as mm:ss (truncated)."""
+    zp_result.time_seconds = "3725.900"
+    zp_result.save(update_fields=["time_seconds"])
+    response = admin_client.get(reverse("admin:zwiftpower_zpriderresults_changelist"))
+    assert response.status_code == 200
+    assert b"62:05" in response.content
+
+
+@pytest.mark.django_db
+def test_weight_height_history_skips_rows_without_either(zp_result, zp_event) -> None:
+    ZPRiderResults.objects.create(event=zp_event, zid=zp_event.zid, zwid=54321, name="Other Rider")
+    ZPRiderResults.objects.filter(pk=zp_result.pk).update(height=180)
+
+    history = list(ZPRiderResults.get_weight_height_history(zp_result.zwid))
+    assert len(history) == 1
+    assert history[0][2] == 180
+    assert list(ZPRiderResults.get_weight_height_history(54321)) == []
+
+
+@pytest.mark.django_db
+def test_team_riders_admin_history_view_renders(admin_client) -> None:
+    rider = ZPTeamRiders.objects.create(zwid=777, name="History Rider", ftp=250)
+    rider.ftp = 255
+    rider.save()
+    response = admin_client.get(reverse("admin:zwiftpower_zpteamriders_history", args=[rider.pk]))
+    assert response.status_code == 200
+    assert b"255" in response.content
+
+
+@pytest.mark.django_db
+def test_res_id_is_generated_from_zid_and_pos(zp_result) -> None:
+    zp_result.refresh_from_db()
+    assert zp_result.res_id == f"{zp_result.zid}.1"
+
+
+@pytest.mark.django_db
+def test_admin_sync_htmx_returns_toast_and_dedupes(admin_client) -> None:
+    """HTMX sync clicks get a 204 toast; a second click while queued is not re-enqueued."""
+    url = reverse("admin:zwiftpower_zpteamriders_sync")
+
+    first = admin_client.post(url, HTTP_HX_REQUEST="true")
+    assert first.status_code == 204
+    assert "has been queued" in first.headers["HX-Trigger"]
+
+    second = admin_client.post(url, HTTP_HX_REQUEST="true")
+    assert second.status_code == 204
+    assert "already queued" in second.headers["HX-Trigger"]
+
+
+@pytest.mark.django_db
+def test_result_str_does_not_query_event(zp_result, django_assert_num_queries) -> None:
+    result = ZPRiderResults.objects.get(pk=zp_result.pk)
+    with django_assert_num_queries(0):
+        assert str(result) == f"Test Rider - event {zp_result.zid} (P1)"
+
+    joined = ZPRiderResults.objects.select_related("event").get(pk=zp_result.pk)
+    assert str(joined) == "Test Rider - Friday Night Crit (P1)"
+
+
+def _zp_rider(zwid: int, name: str, ftp: str) -> dict:
+    return {"zwid": zwid, "name": name, "ftp": [ftp, 0], "w": ["70.0", 0], "div": 20, "skill": 100}
+
+
+@pytest.fixture
+def fake_zp_roster(monkeypatch):
+    # Patch ZPClient in the tasks module; tests fill the returned roster list
+    from apps.zwiftpower import tasks as zp_tasks
+
+    roster: list[dict] = []
+    roster_results: dict = {"events": {}, "data": []}
+
+    class FakeClient:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return None
+
+        def fetch_team_riders(self):
+            return roster
+
+        def fetch_team_results(self):
+            return roster_results
+
+        def fetch_team_data(self):
+            return roster, roster_results
+
+    monkeypatch.setattr(zp_tasks, "ZPClient", FakeClient)
+    return roster
+
+
+@pytest.fixture
+def fake_zp_results(fake_zp_roster):
+    # Team results payload served by the patched ZPClient
+    from apps.zwiftpower import tasks as zp_tasks
+
+    return zp_tasks.ZPClient().fetch_team_results()
+
+
+@pytest.mark.django_db
+def test_update_team_riders_bulk_upserts_with_history(fake_zp_roster) -> None:
+    from apps.zwiftpower.tasks import update_team_riders
+
+    existing = ZPTeamRiders.objects.create(zwid=1001, name="Old Name", ftp=250, div=20, skill=100)
+    fake_zp_roster.extend([_zp_rider(1001, "New Name", "260"), _zp_rider(1002, "Fresh Rider", "300")])
+
+    result = update_team_riders.func()
+    assert result == {"created": 1, "updated": 1, "left": 0}
+
+    existing.refresh_from_db()
+    assert existing.name == "New Name"
+    assert existing.ftp == 260
+    assert [h.history_type for h in existing.history.order_by("history_date")] == ["+", "~"]
+    assert ZPTeamRiders.objects.get(zwid=1002).history.count() == 1
+
+    # Re-running with unchanged tracked fields adds no history rows
+    update_team_riders.func()
+    assert existing.history.count() == 2
+
+
+@pytest.mark.django_db
+def test_update_team_riders_marks_left_riders(fake_zp_roster) -> None:
+    from apps.zwiftpower.tasks import update_team_riders
+
+    gone = ZPTeamRiders.objects.create(zwid=2001, name="Gone Rider")
+    fake_zp_roster.append(_zp_rider(2002, "Still Here", "250"))
+
+    result = update_team_riders.func()
+    assert result["left"] == 1
+
+    gone.refresh_from_db()
+    assert gone.date_left is not None
+    assert ZPTeamRiders.objects.get(zwid=2002).date_left is None
+
+
+@pytest.mark.django_db
+def test_update_team_results_bulk_upserts(fake_zp_results, zp_result, zp_event) -> None:
+    from apps.zwiftpower.tasks import update_team_results
+
+    # zp_event is not in the payload's events dict, so it must be loaded from the DB
+    fake_zp_results["data"].extend([
+        {"zid": zp_event.zid, "zwid": zp_result.zwid, "name": "Renamed", "pos": 2, "time": [3725.5, 0]},
+        {"zid": zp_event.zid, "zwid": 54321, "name": "Second Rider", "pos": 3},
+        {"zid": 111, "zwid": 54321, "name": "Unknown Event"},
+    ])
+
+    result = update_team_results.func()
+    assert result == {"events_created": 0, "events_updated": 0, "results_created": 1, "results_updated": 1}
+
+    zp_result.refresh_from_db()
+    assert zp_result.name == "Renamed"
+    assert zp_result.pos == 2
+    assert zp_result.time_seconds == Decimal("3725.5")
+    assert ZPRiderResults.objects.get(zid=zp_event.zid, zwid=54321).event == zp_event
+    assert not ZPRiderResults.objects.filter(zid=111).exists()
+
+
+@pytest.mark.django_db
+def test_update_team_results_upserts_events(fake_zp_results, zp_event) -> None:
+    from apps.zwiftpower.tasks import update_team_results
+
+    fake_zp_results["events"].update({
+        str(zp_event.zid): {"title": "Friday Night Crit &amp; Sprint", "date": 1700000000},
+        "222": {"title": "New Race", "date": 1700003600},
+    })
+    fake_zp_results["data"].append({"zid": 222, "zwid": 777, "name": "Racer", "pos": 1})
+
+    result = update_team_results.func()
+    assert result["events_created"] == 1
+    assert result["events_updated"] == 1
+    assert result["results_created"] == 1
+
+    zp_event.refresh_from_db()
+    assert zp_event.title == "Friday Night Crit & Sprint"
+    assert ZPRiderResults.objects.get(zwid=777).event.title == "New Race"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("73.5", Decimal("73.5")), (3, Decimal(3)), (71.3, Decimal("71.3")), ("", None), (0, None), ("n/a", None)],
+)
+def test_parse_decimal(raw, expected) -> None:
+    from apps.zwiftpower.tasks import _parse_decimal
+
+    assert _parse_decimal(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("73.5", "73.5"),
+        (3, 3),
+        (2489.576, "2489.576"),
+        (["2.6", 0], "2.6"),
+        ("", None),
+        ("n/a", None),
+        (float("nan"), None),
+        ([], None),
+    ],
+)
+def test_numeric_str(raw, expected) -> None:
+    from apps.zwiftpower.tasks import _numeric_str
+
+    assert _numeric_str(raw) == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("page", "expected"),
+    [
+        ('<form id="login" method="post" action="https://secure.zwift.com/a?x=1&amp;y=2">', "https://secure.zwift.com/a?x=1&y=2"),
+        ("<div><FORM ACTION='/login'></FORM></div>", "/login"),
+    ],
+)
+def test_parse_login_form_url(page, expected) -> None:
+    from apps.zwiftpower.zp_client import ZPClient
+
+    assert ZPClient()._parse_login_form_url(page) == expected
+
+
+@pytest.mark.django_db
+def test_parse_login_form_url_requires_action() -> None:
+    from apps.zwiftpower.zp_client import ZPClient, ZPFormParseError
+
+    with pytest.raises(ZPFormParseError):
+        ZPClient()._parse_login_form_url('<form method="post"></form>')
+    with pytest.raises(ZPFormParseError):
+        ZPClient()._parse_login_form_url("<p>no form here</p>")
+
+
+@pytest.mark.django_db
+def test_check_status_is_cached_between_fetches() -> None:
+    import httpx
+
+    from apps.zwiftpower.zp_client import ZPClient
+
+    requests_seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(str(request.url))
+        return httpx.Response(200, text="<html>Team</html>")
+
+    with ZPClient() as client:
+        client._session = httpx.Client(transport=httpx.MockTransport(handler))
+        assert client.check_status() is True
+        assert client.check_status() is True
+
+    # Only the first check hits the home and events pages
+    assert len(requests_seen) == 2
+
+
+@pytest.mark.django_db
+def test_update_team_all_syncs_riders_and_results(fake_zp_roster, fake_zp_results, zp_event) -> None:
+    from apps.zwiftpower.tasks import update_team_all
+
+    fake_zp_roster.append(_zp_rider(3003, "Both Ways", "280"))
+    fake_zp_results["data"].append({"zid": zp_event.zid, "zwid": 3003, "name": "Both Ways", "pos": 1})
+
+    result = update_team_all.func()
+    assert result["riders"]["created"] == 1
+    assert result["results"]["results_created"] == 1
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("239", 239), (["204", 0], 204), (0, None), ("-5", None), (40000, None), ("x", None), ([], None)],
+)
+def test_parse_positive_small_int(raw, expected) -> None:
+    from apps.zwiftpower.tasks import _parse_positive_small_int
+
+    assert _parse_positive_small_int(raw) == expected
+
+
+@pytest.mark.django_db
+def test_login_reraises_form_parse_error_unwrapped(monkeypatch) -> None:
+    import httpx
+
+    from apps.zwiftpower import zp_client
+    from apps.zwiftpower.zp_client import ZPClient, ZPFormParseError
+
+    real_client = httpx.Client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text="<html>maintenance</html>")
+
+    monkeypatch.setattr(
+        zp_client.httpx, "Client", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)
+    )
+
+    client = ZPClient()
+    with pytest.raises(ZPFormParseError):
+        client.login()
+    assert client.session is None
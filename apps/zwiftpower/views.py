@@ -39,6 +39,23 @@ TEAM_RESULTS_SORT: dict[str, tuple[str, str]] = {
     "weight": ("weight", "-weight"),
 }
 
+# Decimal columns the results pages never render. Deferring them skips a
+# Decimal conversion per column per row.
+RESULT_LIST_DEFERRED_FIELDS: tuple[str, ...] = (
+    "time_gun",
+    "wkg_ftp",
+    "wkg5",
+    "wkg15",
+    "wkg30",
+    "wkg60",
+    "wkg120",
+    "wkg300",
+    "wkg1200",
+    "skill",
+    "skill_gain",
+    "search_vector",
+)
+
 EVENT_RESULTS_SORT: dict[str, tuple[str, str]] = {
     "name": ("name", "-name"),
     "category": ("category", "-category"),
@@ -175,7 +192,7 @@ def team_results_view(request: HttpRequest) -> HttpResponse:
     date_from_raw = request.GET.get("date_from", "").strip()
     date_to_raw = request.GET.get("date_to", "").strip()
 
-    results = ZPRiderResults.objects.select_related("event")
+    results = ZPRiderResults.objects.select_related("event").defer(*RESULT_LIST_DEFERRED_FIELDS)
 
     if search_query:
         results = results.filter(name__icontains=search_query) | results.filter(
@@ -284,7 +301,7 @@ def event_results_view(request: HttpRequest, zid: int) -> HttpResponse:
         default_key="pos",
         default_dir="asc",
     )
-    results = event.results.order_by(sort_expr)
+    results = event.results.defer(*RESULT_LIST_DEFERRED_FIELDS).order_by(sort_expr)
 
     # Quick stats for the header strip
     finishers = results.exclude(pos__isnull=True).count()
@@ -1,12 +1,28 @@
 """ZwiftPower API client for authentication and session management."""
 
-from time import sleep
+import html as html_lib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 from typing import Self
 
 import httpx
 import logfire
 from bs4 import BeautifulSoup
 from constance import config
+from pydantic_core import from_json
+
+# Opening tag of the first <form> and its action attribute; BeautifulSoup is
+# only used when this doesn't match
+FORM_TAG_RE = re.compile(r"<form\b[^>]*>", re.IGNORECASE)
+FORM_ACTION_RE = re.compile(r"""\saction\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+# team_results can be several MB, so allow a generous read timeout
+ZP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+ZP_LIMITS = httpx.Limits(max_keepalive_connections=5)
+
+# Seconds a successful login or status check is trusted before re-probing
+STATUS_CHECK_TTL = 60
 
 
 class ZPLoginError(Exception):
@@ -34,6 +50,7 @@ class ZPClient:
         self.zp_url = "https://zwiftpower.com"
         self.zp_events_url = "https://zwiftpower.com/events.php"
         self._session: httpx.Client | None = None
+        self._status_ok_at: float | None = None
         # User Agent required or will be blocked at some apis
         self.user_agent = (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_8) "
@@ -50,6 +67,7 @@ class ZPClient:
         if self._session is not None:
             self._session.close()
             self._session = None
+            self._status_ok_at = None
             logfire.info("ZPClient session closed")
 
     def __enter__(self) -> Self:
@@ -68,6 +86,9 @@ class ZPClient:
     def check_status(self) -> bool:
         """Check if the session is valid.
 
+        A successful login or check is trusted for ``STATUS_CHECK_TTL``
+        seconds, so back-to-back fetches don't re-probe ZwiftPower.
+
         Returns:
             True if session is valid and authenticated, False otherwise.
 
@@ -75,17 +96,18 @@ class ZPClient:
         try:
             if self._session is None:
                 return False
+            if self._status_ok_at is not None and monotonic() - self._status_ok_at < STATUS_CHECK_TTL:
+                return True
 
             r = self._session.get(self.zp_url)
             r.raise_for_status()
             login_required = "Login Required" in r.text
             logfire.info(f"Status: {r.status_code} Login Required: {login_required}")
 
-            sleep(1)
-
             r = self._session.get(self.zp_events_url)
-            status_ok = r.status_code == 200
-            return status_ok and not login_required
+            status_ok = r.status_code == 200 and not login_required
+            self._status_ok_at = monotonic() if status_ok else None
+            return status_ok
 
         except httpx.RequestError as e:
             logfire.error(f"Request error checking status: {e}")
@@ -107,13 +129,16 @@ class ZPClient:
             ZPFormParseError: If form or action attribute not found.
 
         """
-        soup = BeautifulSoup(html, "html.parser")
-        form = soup.find("form")
-
-        if form is None:
-            raise ZPFormParseError("Login form not found in response")
+        tag = FORM_TAG_RE.search(html)
+        if tag is not None:
+            match = FORM_ACTION_RE.search(tag.group(0))
+            action = html_lib.unescape(next(filter(None, match.groups()), "")) if match else None
+        else:
+            form = BeautifulSoup(html, "html.parser").find("form")
+            if form is None:
+                raise ZPFormParseError("Login form not found in response")
+            action = form.get("action")
 
-        action = form.get("action")
         if not action:
             raise ZPFormParseError("Login form has no action attribute")
 
@@ -155,7 +180,7 @@ class ZPClient:
         # Close existing session if any
         self.close()
 
-        client = httpx.Client()
+        client = httpx.Client(timeout=ZP_TIMEOUT, limits=ZP_LIMITS)
         client.headers.update({"User-Agent": self.user_agent})
 
         try:
@@ -187,6 +212,7 @@ class ZPClient:
 
             logfire.info("Login successful, session created")
             self._session = client
+            self._status_ok_at = monotonic()
 
         except ZPLoginError, ZPFormParseError:
             client.close()
@@ -235,7 +261,7 @@ class ZPClient:
         response.raise_for_status()
 
         try:
-            data: list = response.json()["data"]
+            data: list = from_json(response.content)["data"]
             return data
         except Exception as e:
             logfire.error(f"Error fetching team roster, no data or json error: {e}")
@@ -246,6 +272,9 @@ class ZPClient:
 
         API URL: https://zwiftpower.com/api3.php?do=team_results&id={team_id}
 
+        The payload can be several MB, so it is decoded with pydantic-core's
+        Rust JSON parser, which also interns the keys repeated on every result.
+
         Returns:
             Dict with 'events' (dict of event info) and 'data' (list of rider results).
 
@@ -258,7 +287,7 @@ class ZPClient:
         response.raise_for_status()
 
         try:
-            data: dict = response.json()
+            data: dict = from_json(response.content)
             return {
                 "events": data.get("events", {}),
                 "data": data.get("data", []),
@@ -266,3 +295,22 @@ class ZPClient:
         except Exception as e:
             logfire.error(f"Error fetching team results, no data or json error: {e}")
             return {"events": {}, "data": []}
+
+    def fetch_team_data(self, team_id: int | None = None) -> tuple[list[dict], dict]:
+        """Fetch the team roster and team results concurrently on one session.
+
+        Logs in (or validates the session) once, then issues both API calls
+        from two threads; ``httpx.Client`` is safe to share between threads.
+
+        Returns:
+            Tuple of (team_riders list, team_results dict).
+
+        """
+        self.init_client()
+        if team_id is None:
+            # Resolve here so the worker threads don't open their own DB connections
+            team_id = config.ZWIFTPOWER_TEAM_ID
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            riders = pool.submit(self.fetch_team_riders, team_id)
+            results = pool.submit(self.fetch_team_results, team_id)
+            return riders.result(), results.result()
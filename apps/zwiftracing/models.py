@@ -1,10 +1,14 @@
 """Models for Zwift Racing data."""
 
-from typing import ClassVar
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, ClassVar
 
 from django.db import models
 from simple_history.models import HistoricalRecords
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class ZRRider(models.Model):
     """Zwift Racing rider data from the club, rider and riders APIs.
@@ -248,7 +252,11 @@ class ZRRider(models.Model):
     def save(self, *args, **kwargs) -> None:
         """Save with conditional history creation.
 
-        Only creates a history record if tracked fields changed.
+        Only creates a history record if tracked fields changed. The previous
+        values come from the snapshot taken when the row was loaded, so an
+        extra SELECT is only needed for instances built by hand with a pk.
+        Decimals are compared at their column's precision, since that is all
+        the database keeps.
 
         Args:
             *args: Positional arguments passed to parent save.
@@ -257,67 +265,145 @@ class ZRRider(models.Model):
         """
         if self.pk:
             # Existing record - check if tracked fields changed
-            try:
-                old = ZRRider.objects.get(pk=self.pk)
-                tracked_changed = any(getattr(self, f) != getattr(old, f) for f in self.TRACKED_FIELDS)
-                if not tracked_changed:
-                    # Skip history for this save
-                    self.skip_history_when_saving = True
-            except ZRRider.DoesNotExist:
-                pass
+            old_values = getattr(self, "_tracked_snapshot", None)
+            if old_values is None or len(old_values) != len(self.TRACKED_FIELDS):
+                # Only the tracked columns are needed for the diff
+                old_values = ZRRider.objects.filter(pk=self.pk).values(*self.TRACKED_FIELDS).first()
+            if old_values is not None and all(
+                _round_to_column(f, getattr(self, f)) == old_values[f] for f in self.TRACKED_FIELDS
+            ):
+                # Skip history for this save
+                self.skip_history_when_saving = True
 
         super().save(*args, **kwargs)
 
         # Reset flag
         if hasattr(self, "skip_history_when_saving"):
             del self.skip_history_when_saving
+        self._tracked_snapshot = {f: _round_to_column(f, v) for f, v in self._get_tracked_values().items()}
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: list[str], values: list) -> ZRRider:
+        """Load an instance and snapshot its tracked fields for ``save()``.
+
+        Returns:
+            The loaded ZRRider.
+
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._tracked_snapshot = instance._get_tracked_values()
+        return instance
+
+    def refresh_from_db(self, using: str | None = None, fields: list[str] | None = None, **kwargs) -> None:
+        """Reload from the database and re-snapshot the reloaded tracked fields.
+
+        A partial reload only replaces the snapshot entries for ``fields``, so
+        unsaved edits to other tracked fields still count as changes on save.
+
+        Args:
+            using: Database alias passed to parent refresh_from_db.
+            fields: Fields to reload (None reloads every loaded field).
+            **kwargs: Keyword arguments passed to parent refresh_from_db.
+
+        """
+        super().refresh_from_db(using, fields, **kwargs)
+        if fields is None:
+            self._tracked_snapshot = self._get_tracked_values()
+            return
+        snapshot = getattr(self, "_tracked_snapshot", {})
+        snapshot.update({f: self.__dict__[f] for f in fields if f in self.TRACKED_FIELDS and f in self.__dict__})
+        self._tracked_snapshot = snapshot
+
+    def _get_tracked_values(self) -> dict:
+        """Return the loaded TRACKED_FIELDS values, skipping deferred fields.
+
+        Returns:
+            Dict of field name to value.
+
+        """
+        return {f: self.__dict__[f] for f in self.TRACKED_FIELDS if f in self.__dict__}
 
     @classmethod
-    def get_field_history(cls, zwid: int, field: str) -> list[tuple]:
+    def get_field_history(cls, zwid: int, field: str, limit: int | None = 100) -> Iterator[tuple]:
         """Get history of a specific field for a rider.
 
+        Rows are streamed rather than materialized.
+
         Args:
             zwid: Zwift rider ID.
             field: Field name to get history for.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, value) tuples, newest first.
+            Iterator of (date, value) tuples, newest first.
 
         """
-        return list(
+        qs = (
             cls.history.filter(zwid=zwid)
             .exclude(**{f"{field}__isnull": True})
             .order_by("-history_date")
             .values_list("history_date", field)
         )
+        if limit is not None:
+            qs = qs[:limit]
+        return qs.iterator(chunk_size=500)
 
     @classmethod
-    def get_rating_history(cls, zwid: int) -> list[tuple]:
+    def get_rating_history(cls, zwid: int, limit: int | None = 100) -> Iterator[tuple]:
         """Get race rating history for a rider.
 
         Args:
             zwid: Zwift rider ID.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, rating, category) tuples, newest first.
+            Iterator of (date, rating, category) tuples, newest first.
 
         """
-        return list(
+        qs = (
             cls.history.filter(zwid=zwid)
             .exclude(race_current_rating__isnull=True)
             .order_by("-history_date")
             .values_list("history_date", "race_current_rating", "race_current_category")
         )
+        if limit is not None:
+            qs = qs[:limit]
+        return qs.iterator(chunk_size=500)
 
     @classmethod
-    def get_weight_history(cls, zwid: int) -> list[tuple]:
+    def get_weight_history(cls, zwid: int, limit: int | None = 100) -> Iterator[tuple]:
         """Get weight history for a rider.
 
         Args:
             zwid: Zwift rider ID.
+            limit: Maximum number of rows to return (None for the full history).
 
         Returns:
-            List of (date, weight) tuples, newest first.
+            Iterator of (date, weight) tuples, newest first.
 
         """
-        return cls.get_field_history(zwid, "weight")
+        return cls.get_field_history(zwid, "weight", limit)
+
+
+# Smallest step each ZRRider DecimalField keeps (Decimal("0.01") for
+# decimal_places=2). The database rounds to it on save, so values must be
+# rounded the same way before they are compared with a loaded row.
+ZR_DECIMAL_QUANTA: dict[str, Decimal] = {
+    field.name: Decimal(1).scaleb(-field.decimal_places)
+    for field in ZRRider._meta.concrete_fields
+    if isinstance(field, models.DecimalField)
+}
+
+
+def _round_to_column(field: str, value: object) -> object:
+    """Round a Decimal to ``field``'s stored precision; other values pass through.
+
+    Returns:
+        The rounded Decimal, or ``value`` unchanged.
+
+    """
+    quantum = ZR_DECIMAL_QUANTA.get(field)
+    if quantum is None or not isinstance(value, Decimal):
+        return value
+    # ROUND_HALF_UP rounds ties away from zero, as PostgreSQL numeric does
+    return value.quantize(quantum, rounding=ROUND_HALF_UP)
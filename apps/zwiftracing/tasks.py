@@ -4,39 +4,93 @@ Uses Django 6.0 background tasks feature with django-tasks database backend.
 """
 
 from datetime import timedelta
-from decimal import Decimal, InvalidOperation
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import logfire
 from constance import config
+from django.db import transaction
 from django.tasks import task  # ty:ignore[unresolved-import]
 from django.utils import timezone
 
-from apps.zwiftracing.models import ZRRider
+from apps.zwiftracing.models import ZR_DECIMAL_QUANTA, ZRRider
 from apps.zwiftracing.zr_client import get_club, get_rider
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+# A full club page from ZR caps at 1000 riders; >= this means paginate.
+ZR_PAGE_FULL = 999
+# Minimum spacing between club page requests (ZR club endpoint rate limit).
+ZR_PAGE_DELAY_S = 630
+# Decimals are immutable, so one zero can be shared by every parsed field.
+DECIMAL_ZERO = Decimal(0)
+
 
 def _parse_decimal(value: float | int | str | None) -> Decimal | None:
     """Parse a value to Decimal, returning None if invalid.
 
+    Ints and strings go straight to the Decimal constructor; floats (most ZR
+    values) go through ``repr()`` so they keep their shortest form (``72.3``)
+    rather than the binary expansion ``Decimal(72.3)`` would give. Numeric
+    zeros (common in sparse payloads) return the shared ``DECIMAL_ZERO``.
+
     Returns:
         Decimal value or None if parsing fails.
 
     """
     if value is None or value == "":
         return None
+    value_type = type(value)
+    if (value_type is int or value_type is float) and not value:
+        return DECIMAL_ZERO
+    if value_type is float:
+        value = repr(value)
+    elif value_type is not int and value_type is not str:
+        value = str(value)
     try:
-        return Decimal(str(value))
+        return Decimal(value)
     except (InvalidOperation, ValueError):
         return None
 
 
+def _column_decimal(field: str) -> Callable[[Any], Decimal | None]:
+    """Build a converter that parses a Decimal and rounds it like ``field``'s column.
+
+    ZR values carry far more digits than the columns keep (a rating of
+    ``2377.733340575707`` is stored as ``2377.73``). Rounding at parse time
+    makes mapped values compare equal to the stored row when nothing changed.
+
+    Args:
+        field: ZRRider DecimalField name.
+
+    Returns:
+        Converter returning the rounded Decimal, or None if parsing fails.
+
+    """
+    quantum = ZR_DECIMAL_QUANTA[field]
+
+    def convert(value: float | int | str | None) -> Decimal | None:
+        parsed = _parse_decimal(value)
+        # ROUND_HALF_UP rounds ties away from zero, as PostgreSQL numeric does
+        return None if parsed is None else parsed.quantize(quantum, rounding=ROUND_HALF_UP)
+
+    return convert
+
+
 def _parse_int(value: int | str | None) -> int | None:
     """Parse a value to int, returning None if invalid.
 
+    Ints (most ZR values) are returned as-is before any other checks.
+
     Returns:
         int value or None if parsing fails.
 
     """
+    if type(value) is int:
+        return value
     if value is None or value == "":
         return None
     try:
@@ -45,9 +99,155 @@ def _parse_int(value: int | str | None) -> int | None:
         return None
 
 
+def _str_or_empty(value: object) -> object:
+    """Return the value, or an empty string if it is missing or falsy.
+
+    Returns:
+        The value or ``""``.
+
+    """
+    return value or ""
+
+
+def _int_or_zero(value: object) -> object:
+    """Return the value, or 0 if it is missing or falsy.
+
+    Returns:
+        The value or ``0``.
+
+    """
+    return value or 0
+
+
+# Shared read-only stand-in for a missing or null nested object
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Nested API objects, resolved once per rider: (section, parent section, key).
+# A missing or null object resolves to _EMPTY.
+ZR_SECTIONS: tuple[tuple[str, str, str], ...] = (
+    ("power", "rider", "power"),
+    ("race", "rider", "race"),
+    ("race_current", "race", "current"),
+    ("race_current_mixed", "race_current", "mixed"),
+    ("race_last", "race", "last"),
+    ("race_last_mixed", "race_last", "mixed"),
+    ("race_max30", "race", "max30"),
+    ("race_max30_mixed", "race_max30", "mixed"),
+    ("race_max90", "race", "max90"),
+    ("race_max90_mixed", "race_max90", "mixed"),
+    ("handicaps", "rider", "handicaps"),
+    ("handicaps_profile", "handicaps", "profile"),
+    ("phenotype", "rider", "phenotype"),
+    ("phenotype_scores", "phenotype", "scores"),
+    ("club", "rider", "club"),
+    ("seed", "rider", "seed"),
+    ("seed_factors", "seed", "factors"),
+    ("velo", "rider", "velo"),
+    ("velo_factors", "velo", "factors"),
+)
+
+# ZRRider field <- API value: (model field, section, key, converter)
+ZR_FIELDS: tuple[tuple[str, str, str, Callable[[Any], Any]], ...] = (
+    # Basic info
+    ("name", "rider", "name", _str_or_empty),
+    ("gender", "rider", "gender", _str_or_empty),
+    ("country", "rider", "country", _str_or_empty),
+    ("age", "rider", "age", _str_or_empty),
+    ("height", "rider", "height", _parse_int),
+    ("weight", "rider", "weight", _column_decimal("weight")),
+    # ZwiftPower category
+    ("zp_category", "rider", "zpCategory", _str_or_empty),
+    ("zp_ftp", "rider", "zpFTP", _parse_int),
+    # Power data - w/kg
+    ("power_wkg5", "power", "wkg5", _column_decimal("power_wkg5")),
+    ("power_wkg15", "power", "wkg15", _column_decimal("power_wkg15")),
+    ("power_wkg30", "power", "wkg30", _column_decimal("power_wkg30")),
+    ("power_wkg60", "power", "wkg60", _column_decimal("power_wkg60")),
+    ("power_wkg120", "power", "wkg120", _column_decimal("power_wkg120")),
+    ("power_wkg300", "power", "wkg300", _column_decimal("power_wkg300")),
+    ("power_wkg1200", "power", "wkg1200", _column_decimal("power_wkg1200")),
+    # Power data - watts
+    ("power_w5", "power", "w5", _parse_int),
+    ("power_w15", "power", "w15", _parse_int),
+    ("power_w30", "power", "w30", _parse_int),
+    ("power_w60", "power", "w60", _parse_int),
+    ("power_w120", "power", "w120", _parse_int),
+    ("power_w300", "power", "w300", _parse_int),
+    ("power_w1200", "power", "w1200", _parse_int),
+    # Power metrics
+    ("power_cp", "power", "CP", _column_decimal("power_cp")),
+    ("power_awc", "power", "AWC", _column_decimal("power_awc")),
+    ("power_compound_score", "power", "compoundScore", _column_decimal("power_compound_score")),
+    # Race rating - current
+    ("race_current_rating", "race_current", "rating", _column_decimal("race_current_rating")),
+    ("race_current_date", "race_current", "date", _parse_int),
+    ("race_current_category", "race_current_mixed", "category", _str_or_empty),
+    ("race_current_category_num", "race_current_mixed", "number", _parse_int),
+    # Race rating - last
+    ("race_last_rating", "race_last", "rating", _column_decimal("race_last_rating")),
+    ("race_last_date", "race_last", "date", _parse_int),
+    ("race_last_category", "race_last_mixed", "category", _str_or_empty),
+    ("race_last_category_num", "race_last_mixed", "number", _parse_int),
+    # Race rating - max30
+    ("race_max30_rating", "race_max30", "rating", _column_decimal("race_max30_rating")),
+    ("race_max30_date", "race_max30", "date", _parse_int),
+    ("race_max30_expires", "race_max30", "expires", _parse_int),
+    ("race_max30_category", "race_max30_mixed", "category", _str_or_empty),
+    ("race_max30_category_num", "race_max30_mixed", "number", _parse_int),
+    # Race rating - max90
+    ("race_max90_rating", "race_max90", "rating", _column_decimal("race_max90_rating")),
+    ("race_max90_date", "race_max90", "date", _parse_int),
+    ("race_max90_expires", "race_max90", "expires", _parse_int),
+    ("race_max90_category", "race_max90_mixed", "category", _str_or_empty),
+    ("race_max90_category_num", "race_max90_mixed", "number", _parse_int),
+    # Race stats
+    ("race_finishes", "race", "finishes", _int_or_zero),
+    ("race_dnfs", "race", "dnfs", _int_or_zero),
+    ("race_wins", "race", "wins", _int_or_zero),
+    ("race_podiums", "race", "podiums", _int_or_zero),
+    # Handicaps
+    ("handicap_flat", "handicaps_profile", "flat", _column_decimal("handicap_flat")),
+    ("handicap_rolling", "handicaps_profile", "rolling", _column_decimal("handicap_rolling")),
+    ("handicap_hilly", "handicaps_profile", "hilly", _column_decimal("handicap_hilly")),
+    ("handicap_mountainous", "handicaps_profile", "mountainous", _column_decimal("handicap_mountainous")),
+    # Phenotype
+    ("phenotype_value", "phenotype", "value", _str_or_empty),
+    ("phenotype_bias", "phenotype", "bias", _column_decimal("phenotype_bias")),
+    ("phenotype_sprinter", "phenotype_scores", "sprinter", _column_decimal("phenotype_sprinter")),
+    ("phenotype_puncheur", "phenotype_scores", "puncheur", _column_decimal("phenotype_puncheur")),
+    ("phenotype_pursuiter", "phenotype_scores", "pursuiter", _column_decimal("phenotype_pursuiter")),
+    ("phenotype_climber", "phenotype_scores", "climber", _column_decimal("phenotype_climber")),
+    ("phenotype_tt", "phenotype_scores", "tt", _column_decimal("phenotype_tt")),
+    # Club info
+    ("club_id", "club", "id", _parse_int),
+    ("club_name", "club", "name", _str_or_empty),
+    # Seed ratings
+    ("seed_race", "seed", "race", _column_decimal("seed_race")),
+    ("seed_time_trial", "seed", "timeTrial", _column_decimal("seed_time_trial")),
+    ("seed_endurance", "seed_factors", "endurance", _column_decimal("seed_endurance")),
+    ("seed_pursuit", "seed_factors", "pursuit", _column_decimal("seed_pursuit")),
+    ("seed_sprint", "seed_factors", "sprint", _column_decimal("seed_sprint")),
+    ("seed_punch", "seed_factors", "punch", _column_decimal("seed_punch")),
+    ("seed_climb", "seed_factors", "climb", _column_decimal("seed_climb")),
+    ("seed_tt_factor", "seed_factors", "timeTrial", _column_decimal("seed_tt_factor")),
+    # Velo ratings
+    ("velo_race", "velo", "race", _column_decimal("velo_race")),
+    ("velo_time_trial", "velo", "timeTrial", _column_decimal("velo_time_trial")),
+    ("velo_endurance", "velo_factors", "endurance", _column_decimal("velo_endurance")),
+    ("velo_pursuit", "velo_factors", "pursuit", _column_decimal("velo_pursuit")),
+    ("velo_sprint", "velo_factors", "sprint", _column_decimal("velo_sprint")),
+    ("velo_punch", "velo_factors", "punch", _column_decimal("velo_punch")),
+    ("velo_climb", "velo_factors", "climb", _column_decimal("velo_climb")),
+    ("velo_tt_factor", "velo_factors", "timeTrial", _column_decimal("velo_tt_factor")),
+)
+
+
 def _map_rider_to_model(rider: dict) -> dict:
     """Map API rider data to ZRRider model fields.
 
+    Driven by ``ZR_SECTIONS`` and ``ZR_FIELDS``: each nested object is looked
+    up once, then every field is a single ``.get()`` plus its converter.
+
     Args:
         rider: Rider data from the API.
 
@@ -55,115 +255,16 @@ def _map_rider_to_model(rider: dict) -> dict:
         Dictionary of model field values.
 
     """
-    power = rider.get("power", {}) or {}
-    race = rider.get("race", {}) or {}
-    race_current = race.get("current", {}) or {}
-    race_last = race.get("last", {}) or {}
-    race_max30 = race.get("max30", {}) or {}
-    race_max90 = race.get("max90", {}) or {}
-    handicaps = rider.get("handicaps", {}) or {}
-    handicaps_profile = handicaps.get("profile", {}) or {}
-    phenotype = rider.get("phenotype", {}) or {}
-    phenotype_scores = phenotype.get("scores", {}) or {}
-    club = rider.get("club", {}) or {}
-    seed = rider.get("seed", {}) or {}
-    seed_factors = seed.get("factors", {}) or {}
-    velo = rider.get("velo", {}) or {}
-    velo_factors = velo.get("factors", {}) or {}
-
-    return {
-        # Basic info
-        "name": rider.get("name") or "",
-        "gender": rider.get("gender") or "",
-        "country": rider.get("country") or "",
-        "age": rider.get("age") or "",
-        "height": _parse_int(rider.get("height")),
-        "weight": _parse_decimal(rider.get("weight")),
-        # ZwiftPower category
-        "zp_category": rider.get("zpCategory") or "",
-        "zp_ftp": _parse_int(rider.get("zpFTP")),
-        # Power data - w/kg
-        "power_wkg5": _parse_decimal(power.get("wkg5")),
-        "power_wkg15": _parse_decimal(power.get("wkg15")),
-        "power_wkg30": _parse_decimal(power.get("wkg30")),
-        "power_wkg60": _parse_decimal(power.get("wkg60")),
-        "power_wkg120": _parse_decimal(power.get("wkg120")),
-        "power_wkg300": _parse_decimal(power.get("wkg300")),
-        "power_wkg1200": _parse_decimal(power.get("wkg1200")),
-        # Power data - watts
-        "power_w5": _parse_int(power.get("w5")),
-        "power_w15": _parse_int(power.get("w15")),
-        "power_w30": _parse_int(power.get("w30")),
-        "power_w60": _parse_int(power.get("w60")),
-        "power_w120": _parse_int(power.get("w120")),
-        "power_w300": _parse_int(power.get("w300")),
-        "power_w1200": _parse_int(power.get("w1200")),
-        # Power metrics
-        "power_cp": _parse_decimal(power.get("CP")),
-        "power_awc": _parse_decimal(power.get("AWC")),
-        "power_compound_score": _parse_decimal(power.get("compoundScore")),
-        # Race rating - current
-        "race_current_rating": _parse_decimal(race_current.get("rating")),
-        "race_current_date": _parse_int(race_current.get("date")),
-        "race_current_category": (race_current.get("mixed", {}) or {}).get("category") or "",
-        "race_current_category_num": _parse_int((race_current.get("mixed", {}) or {}).get("number")),
-        # Race rating - last
-        "race_last_rating": _parse_decimal(race_last.get("rating")),
-        "race_last_date": _parse_int(race_last.get("date")),
-        "race_last_category": (race_last.get("mixed", {}) or {}).get("category") or "",
-        "race_last_category_num": _parse_int((race_last.get("mixed", {}) or {}).get("number")),
-        # Race rating - max30
-        "race_max30_rating": _parse_decimal(race_max30.get("rating")),
-        "race_max30_date": _parse_int(race_max30.get("date")),
-        "race_max30_expires": _parse_int(race_max30.get("expires")),
-        "race_max30_category": (race_max30.get("mixed", {}) or {}).get("category") or "",
-        "race_max30_category_num": _parse_int((race_max30.get("mixed", {}) or {}).get("number")),
-        # Race rating - max90
-        "race_max90_rating": _parse_decimal(race_max90.get("rating")),
-        "race_max90_date": _parse_int(race_max90.get("date")),
-        "race_max90_expires": _parse_int(race_max90.get("expires")),
-        "race_max90_category": (race_max90.get("mixed", {}) or {}).get("category") or "",
-        "race_max90_category_num": _parse_int((race_max90.get("mixed", {}) or {}).get("number")),
-        # Race stats
-        "race_finishes": race.get("finishes", 0) or 0,
-        "race_dnfs": race.get("dnfs", 0) or 0,
-        "race_wins": race.get("wins", 0) or 0,
-        "race_podiums": race.get("podiums", 0) or 0,
-        # Handicaps
-        "handicap_flat": _parse_decimal(handicaps_profile.get("flat")),
-        "handicap_rolling": _parse_decimal(handicaps_profile.get("rolling")),
-        "handicap_hilly": _parse_decimal(handicaps_profile.get("hilly")),
-        "handicap_mountainous": _parse_decimal(handicaps_profile.get("mountainous")),
-        # Phenotype
-        "phenotype_value": phenotype.get("value") or "",
-        "phenotype_bias": _parse_decimal(phenotype.get("bias")),
-        "phenotype_sprinter": _parse_decimal(phenotype_scores.get("sprinter")),
-        "phenotype_puncheur": _parse_decimal(phenotype_scores.get("puncheur")),
-        "phenotype_pursuiter": _parse_decimal(phenotype_scores.get("pursuiter")),
-        "phenotype_climber": _parse_decimal(phenotype_scores.get("climber")),
-        "phenotype_tt": _parse_decimal(phenotype_scores.get("tt")),
-        # Club info
-        "club_id": _parse_int(club.get("id")),
-        "club_name": club.get("name") or "",
-        # Seed ratings
-        "seed_race": _parse_decimal(seed.get("race")),
-        "seed_time_trial": _parse_decimal(seed.get("timeTrial")),
-        "seed_endurance": _parse_decimal(seed_factors.get("endurance")),
-        "seed_pursuit": _parse_decimal(seed_factors.get("pursuit")),
-        "seed_sprint": _parse_decimal(seed_factors.get("sprint")),
-        "seed_punch": _parse_decimal(seed_factors.get("punch")),
-        "seed_climb": _parse_decimal(seed_factors.get("climb")),
-        "seed_tt_factor": _parse_decimal(seed_factors.get("timeTrial")),
-        # Velo ratings
-        "velo_race": _parse_decimal(velo.get("race")),
-        "velo_time_trial": _parse_decimal(velo.get("timeTrial")),
-        "velo_endurance": _parse_decimal(velo_factors.get("endurance")),
-        "velo_pursuit": _parse_decimal(velo_factors.get("pursuit")),
-        "velo_sprint": _parse_decimal(velo_factors.get("sprint")),
-        "velo_punch": _parse_decimal(velo_factors.get("punch")),
-        "velo_climb": _parse_decimal(velo_factors.get("climb")),
-        "velo_tt_factor": _parse_decimal(velo_factors.get("timeTrial")),
-    }
+    sections = {"rider": rider}
+    for name, parent, key in ZR_SECTIONS:
+        sections[name] = sections[parent].get(key) or _EMPTY
+    return {field: convert(sections[section].get(key)) for field, section, key, convert in ZR_FIELDS}
+
+
+# Columns written by _map_rider_to_model; sync_zr_riders overwrites these (plus
+# date_modified) only for riders whose mapped values actually changed
+ZR_MAPPED_FIELDS: list[str] = [field for field, _, _, _ in ZR_FIELDS]
+ZR_RIDER_UPDATE_FIELDS: list[str] = [*ZR_MAPPED_FIELDS, "date_modified"]
 
 
 def refresh_rider_sync(zwid: int) -> tuple[int, ZRRider | None]:
@@ -194,15 +295,44 @@ def refresh_rider_sync(zwid: int) -> tuple[int, ZRRider | None]:
         return status_code, rider
 
 
+def _mark_zr_riders_left(seen: list[int]) -> int:
+    """Mark active riders the club sync did not see as having left.
+
+    Args:
+        seen: Zwift IDs returned by every page of the run.
+
+    Returns:
+        Number of riders marked as left.
+
+    """
+    # One read for the log line, one UPDATE for all of them
+    left_riders = list(
+        ZRRider.objects.filter(date_left__isnull=True).exclude(zwid__in=seen).values_list("pk", "zwid", "name")
+    )
+    if left_riders:
+        ZRRider.objects.filter(pk__in=[pk for pk, _, _ in left_riders]).update(date_left=timezone.now())
+        logfire.info(
+            "{count} ZR riders left club",
+            count=len(left_riders),
+            riders=[(name, zwid) for _, zwid, name in left_riders],
+        )
+    return len(left_riders)
+
+
 @task
-def sync_zr_riders(from_id: int | None = None) -> dict:
+def sync_zr_riders(from_id: int | None = None, seen: list[int] | None = None) -> dict:
     """Sync ZRRider data from Zwift Racing API.
 
     Fetches club riders from the Zwift Racing API and updates the database.
     Handles pagination (if >= 999 riders) and rate limiting (429 status).
+    The Zwift IDs on each page are carried over to the next page's task, so
+    once the last page is processed, active riders missing from that set have
+    left the club and are marked with ``date_left``.
 
     Args:
         from_id: Optional rider ID to paginate from.
+        seen: Zwift IDs returned by earlier pages of this run (internal,
+            passed along to later pages and retries).
 
     Returns:
         dict with sync status and counts.
@@ -211,7 +341,10 @@ def sync_zr_riders(from_id: int | None = None) -> dict:
     with logfire.span("sync_zr_riders", from_id=from_id):
         club_id = config.ZWIFTPOWER_TEAM_ID
 
-        # Call the API
+        # Call the API. The next page's rate-limit window starts at this
+        # request, so the DB work below overlaps it rather than adding to it.
+        requested_at = timezone.now()
+        seen = seen or []
         status_code, data = get_club(club_id, from_id)
 
         # Handle rate limiting (429)
@@ -219,7 +352,7 @@ def sync_zr_riders(from_id: int | None = None) -> dict:
             retry_after = int(data.get("retryAfter", 600))
             run_at = timezone.now() + timedelta(seconds=retry_after)
             logfire.warning(f"Rate limited, retrying in {retry_after} seconds at {run_at}")
-            sync_zr_riders.using(run_after=run_at).enqueue(from_id)
+            sync_zr_riders.using(run_after=run_at).enqueue(from_id, seen)
             return {
                 "status": "rate_limited",
                 "retry_after": retry_after,
@@ -229,35 +362,90 @@ def sync_zr_riders(from_id: int | None = None) -> dict:
         riders = data.get("riders", [])
         if not riders:
             logfire.warning("No riders data returned from Zwift Racing API")
-            return {"status": "complete", "processed": 0, "created": 0, "updated": 0}
-
-        created_count = 0
-        updated_count = 0
-
-        for rider in riders:
-            zwid = rider.get("riderId")
-            if not zwid:
-                continue
-
-            defaults = _map_rider_to_model(rider)
-
-            obj, created = ZRRider.objects.update_or_create(
-                zwid=zwid,
-                defaults=defaults,
-            )
-
+            # An empty first page is an API problem, not an empty club; an
+            # empty later page just means the previous page was the last one
+            left = _mark_zr_riders_left(seen) if from_id is not None else 0
+            return {"status": "complete", "processed": 0, "created": 0, "updated": 0, "left": left}
+
+        with transaction.atomic():
+            # One SELECT for the riders on this page we already know about: the
+            # mapped columns (to skip rows the API reports unchanged), plus the
+            # one the upsert leaves alone so history rows stay accurate
+            page_zwids = [zwid for rider in riders if (zwid := rider.get("riderId"))]
+            existing = {
+                row["zwid"]: row
+                for row in ZRRider.objects.filter(zwid__in=page_zwids).values("zwid", "date_created", *ZR_MAPPED_FIELDS)
+            }
+            upserts: dict[int, ZRRider] = {}
+            tracked_changed: set[int] = set()
+            unchanged: list[int] = []
+            # Built once per page; each call compares the whole column set in C
+            mapped_values = itemgetter(*ZR_MAPPED_FIELDS)
+            tracked_values = itemgetter(*ZRRider.TRACKED_FIELDS)
+
+            for rider in riders:
+                zwid = rider.get("riderId")
+                if not zwid:
+                    continue
+
+                defaults = _map_rider_to_model(rider)
+                old = existing.get(zwid)
+                if old is not None and mapped_values(old) == mapped_values(defaults):
+                    unchanged.append(zwid)
+                    continue
+
+                # Every mapped field is a plain concrete column (no relations or
+                # custom descriptors), so fill __dict__ directly instead of
+                # routing ~76 kwargs through Model.__init__
+                obj = ZRRider(zwid=zwid)
+                obj.__dict__.update(defaults)
+                upserts[zwid] = obj
+                # Only changes to tracked fields get a history row (see ZRRider.save).
+                # Both sides are rounded to column precision, so sub-precision
+                # jitter in ZR ratings and w/kg does not count as a change.
+                if old is not None and tracked_values(old) != tracked_values(defaults):
+                    tracked_changed.add(zwid)
+
+            # Single INSERT ... ON CONFLICT (zwid) DO UPDATE per batch, only for
+            # new or changed riders. PKs are set on inserted and updated objects
+            # alike, so history rows can be built straight from them.
+            if upserts:
+                ZRRider.objects.bulk_create(
+                    list(upserts.values()),
+                    update_conflicts=True,
+                    unique_fields=["zwid"],
+                    update_fields=ZR_RIDER_UPDATE_FIELDS,
+                    batch_size=500,
+                )
+            # Unchanged riders were still seen by the sync: bump date_modified
+            # only, rather than rewriting every mapped column
+            if unchanged:
+                ZRRider.objects.filter(zwid__in=unchanged).update(date_modified=timezone.now())
+            created = [obj for zwid, obj in upserts.items() if zwid not in existing]
             if created:
-                created_count += 1
-                logfire.info(f"Created ZR rider: {obj.name} ({zwid})")
-            else:
-                updated_count += 1
+                ZRRider.history.bulk_history_create(created, batch_size=500)
+            if tracked_changed:
+                changed = []
+                for zwid in tracked_changed:
+                    obj = upserts[zwid]
+                    obj.date_created = existing[zwid]["date_created"]
+                    changed.append(obj)
+                ZRRider.history.bulk_history_create(changed, batch_size=500, update=True)
+            # Riders on this page are club members, so clear date_left for any
+            # who had been marked as left and are back
+            ZRRider.objects.filter(zwid__in=page_zwids, date_left__isnull=False).update(date_left=None)
+
+        created_count = len(created)
+        updated_count = len(upserts) + len(unchanged) - created_count
+        if created:
+            logfire.info("Created {count} ZR riders", count=created_count, riders=[(o.name, o.zwid) for o in created])
 
         # Handle pagination - if we got 999 riders, there may be more
-        if len(riders) >= 999:
+        if len(riders) >= ZR_PAGE_FULL:
             last_rider_id = riders[-1]["riderId"]
-            run_at = timezone.now() + timedelta(seconds=630)
+            run_at = requested_at + timedelta(seconds=ZR_PAGE_DELAY_S)
             logfire.info(f"Paginating: got {len(riders)} riders, continuing from {last_rider_id} at {run_at}")
-            sync_zr_riders.using(run_after=run_at).enqueue(last_rider_id)
+            sync_zr_riders.using(run_after=run_at).enqueue(last_rider_id, [*seen, *page_zwids])
             return {
                 "status": "paginating",
                 "processed": len(riders),
@@ -266,10 +454,12 @@ def sync_zr_riders(from_id: int | None = None) -> dict:
                 "next_from_id": last_rider_id,
             }
 
-        logfire.info(f"ZR Riders sync complete: {created_count} created, {updated_count} updated")
+        left_count = _mark_zr_riders_left([*seen, *page_zwids])
+        logfire.info(f"ZR Riders sync complete: {created_count} created, {updated_count} updated, {left_count} left")
         return {
             "status": "complete",
             "processed": len(riders),
             "created": created_count,
             "updated": updated_count,
+            "left": left_count,
         }
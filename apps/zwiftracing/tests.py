@@ -1 +1,282 @@
-# Create your tests here.
+"""Tests for Zwift Racing tasks."""
+
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from apps.zwiftracing.models import ZRRider
+
+ZR_CLUB_EXAMPLE = Path(__file__).resolve().parents[2] / "test" / "example_data" / "zwiftracing" / "club_api.json"
+
+
+def _zr_rider(zwid: int, name: str, rating: float) -> dict:
+    return {
+        "riderId": zwid,
+        "name": name,
+        "weight": 72.5,
+        "power": {"wkg5": 12.1, "w5": 880},
+        "race": {"current": {"rating": rating, "mixed": {"category": "Sapphire", "number": 3}}, "finishes": 10},
+    }
+
+
+@pytest.fixture
+def fake_zr_club(monkeypatch):
+    # Patch get_club in the tasks module; tests fill the returned riders list
+    from apps.zwiftracing import tasks as zr_tasks
+
+    riders: list[dict] = []
+    monkeypatch.setattr(zr_tasks, "get_club", lambda club_id, from_id=None: (200, {"riders": riders}))
+    return riders
+
+
+@pytest.mark.django_db
+def test_sync_zr_riders_bulk_upserts_with_history(fake_zr_club) -> None:
+    from apps.zwiftracing.tasks import sync_zr_riders
+
+    existing = ZRRider.objects.create(zwid=1001, name="Old Name", race_current_rating=1500)
+    fake_zr_club.extend([_zr_rider(1001, "New Name", 1550.5), _zr_rider(1002, "Fresh Rider", 1200.0)])
+
+    result = sync_zr_riders.func()
+    assert result["created"] == 1
+    assert result["updated"] == 1
+
+    existing.refresh_from_db()
+    assert existing.name == "New Name"
+    assert existing.race_current_rating == Decimal("1550.5")
+    assert existing.race_current_category == "Sapphire"
+    assert [h.history_type for h in existing.history.order_by("history_date")] == ["+", "~"]
+    latest = existing.history.latest()
+    assert latest.race_current_rating == Decimal("1550.5")
+    assert latest.date_created == existing.date_created
+    assert ZRRider.objects.get(zwid=1002).history.count() == 1
+
+    # Re-running with unchanged data skips the upsert: no history rows, but
+    # date_modified still records that the riders were seen
+    before = existing.date_modified
+    result = sync_zr_riders.func()
+    assert result["created"] == 0
+    assert result["updated"] == 2
+    assert existing.history.count() == 2
+    existing.refresh_from_db()
+    assert existing.date_modified > before
+
+
+@pytest.mark.django_db
+def test_resync_of_real_payload_skips_upsert_and_history(fake_zr_club) -> None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from apps.zwiftracing.tasks import sync_zr_riders
+
+    # Real ZR values carry more digits than the columns keep
+    fake_zr_club.extend(json.loads(ZR_CLUB_EXAMPLE.read_text())["riders"])
+    assert sync_zr_riders.func()["created"] == len(fake_zr_club)
+    assert ZRRider.objects.get(zwid=514).race_current_rating == Decimal("2377.73")
+    history_rows = ZRRider.history.count()
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = sync_zr_riders.func()
+    assert result["created"] == 0
+    assert not [q for q in ctx.captured_queries if 'INSERT INTO "zwiftracing_zrrider"' in q["sql"]]
+    assert ZRRider.history.count() == history_rows
+
+
+@pytest.mark.django_db
+def test_sync_history_ignores_sub_precision_tracked_changes(fake_zr_club) -> None:
+    from apps.zwiftracing.tasks import sync_zr_riders
+
+    rider = json.loads(ZR_CLUB_EXAMPLE.read_text())["riders"][0]
+    fake_zr_club.append(rider)
+    sync_zr_riders.func()
+
+    # An untracked change forces the upsert; the rating moves below the stored precision
+    rider["race"]["wins"] += 1
+    rider["race"]["current"]["rating"] += 0.001
+    sync_zr_riders.func()
+    stored = ZRRider.objects.get(zwid=rider["riderId"])
+    assert stored.race_wins == 2
+    assert stored.history.count() == 1
+
+    rider["race"]["current"]["rating"] += 10
+    sync_zr_riders.func()
+    assert stored.history.count() == 2
+
+
+@pytest.mark.django_db
+def test_sync_zr_riders_marks_left_and_returning_riders(fake_zr_club) -> None:
+    from django.utils import timezone
+
+    from apps.zwiftracing.tasks import sync_zr_riders
+
+    ZRRider.objects.create(zwid=5001, name="Leaver")
+    ZRRider.objects.create(zwid=5002, name="Returning", date_left=timezone.now())
+    ZRRider.objects.create(zwid=5003, name="Earlier Page")
+
+    # An empty first page is treated as an API problem, not an empty club
+    assert sync_zr_riders.func()["left"] == 0
+    assert ZRRider.objects.get(zwid=5001).date_left is None
+
+    # Last page of a paginated run: riders from earlier pages are not leavers,
+    # however recently their rows were touched by anything else
+    fake_zr_club.append(_zr_rider(5002, "Returning", 1300.0))
+    ZRRider.objects.filter(zwid=5001).update(date_modified=timezone.now())
+    result = sync_zr_riders.func(from_id=5000, seen=[5003])
+    assert result["left"] == 1
+    assert ZRRider.objects.get(zwid=5001).date_left is not None
+    assert ZRRider.objects.get(zwid=5002).date_left is None
+    assert ZRRider.objects.get(zwid=5003).date_left is None
+
+
+@pytest.mark.django_db
+def test_save_diffs_tracked_fields_without_reloading(django_assert_num_queries) -> None:
+    ZRRider.objects.create(zwid=2001, name="Rider", weight=Decimal("70.0"))
+    rider = ZRRider.objects.get(zwid=2001)
+
+    # Untracked change: just the UPDATE, no SELECT and no history row
+    rider.race_wins = 3
+    with django_assert_num_queries(1):
+        rider.save()
+    assert rider.history.count() == 1
+
+    rider.weight = Decimal("69.5")
+    rider.save()
+    assert rider.history.count() == 2
+
+
+@pytest.mark.django_db
+def test_save_hand_built_instance_diffs_tracked_columns_only(django_assert_num_queries) -> None:
+    original = ZRRider.objects.create(zwid=2002, name="Rider", weight=Decimal("70.0"))
+
+    # Built by hand with a pk, so there is no load-time snapshot to diff against.
+    # auto_now_add only fills date_created on insert, so carry it over.
+    rider = ZRRider(
+        pk=original.pk,
+        zwid=2002,
+        name="Renamed",
+        weight=Decimal("70.0"),
+        date_created=original.date_created,
+    )
+    with django_assert_num_queries(2) as ctx:
+        rider.save()
+    assert "race_wins" not in ctx.captured_queries[0]["sql"]
+    assert rider.history.count() == 1
+
+
+@pytest.mark.django_db
+def test_save_diffs_tracked_decimals_at_column_precision() -> None:
+    ZRRider.objects.create(zwid=2003, name="Rider", weight=Decimal("70.0"))
+    rider = ZRRider.objects.get(zwid=2003)
+
+    # weight keeps one decimal place, so this is the stored value
+    rider.weight = Decimal("70.04")
+    rider.save()
+    assert rider.history.count() == 1
+
+    # A partial reload must not snapshot the unsaved weight edit
+    rider.weight = Decimal("69.0")
+    rider.refresh_from_db(fields=["height"])
+    rider.save()
+    assert rider.history.count() == 2
+
+
+@pytest.mark.django_db
+def test_refresh_rider_sync_skips_history_for_unchanged_rider(monkeypatch) -> None:
+    from apps.zwiftracing import tasks as zr_tasks
+
+    payload = json.loads(ZR_CLUB_EXAMPLE.read_text())["riders"][0]
+    monkeypatch.setattr(zr_tasks, "get_rider", lambda zwid: (200, payload))
+
+    zr_tasks.refresh_rider_sync(payload["riderId"])
+    _, rider = zr_tasks.refresh_rider_sync(payload["riderId"])
+    assert rider.history.count() == 1
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (72.3, Decimal("72.3")),
+        (1550, Decimal(1550)),
+        ("3.25", Decimal("3.25")),
+        (0, Decimal(0)),
+        (0.0, Decimal(0)),
+        (False, None),
+        ("", None),
+        ("x", None),
+    ],
+)
+def test_parse_decimal(raw, expected) -> None:
+    from apps.zwiftracing.tasks import _parse_decimal
+
+    assert _parse_decimal(raw) == expected
+
+
+def test_map_rider_to_model_fills_missing_sections() -> None:
+    from apps.zwiftracing.tasks import ZR_MAPPED_FIELDS, _map_rider_to_model
+
+    mapped = _map_rider_to_model(_zr_rider(3001, "Mapped", 1400.0))
+    assert list(mapped) == ZR_MAPPED_FIELDS
+    assert mapped["race_current_rating"] == Decimal("1400.0")
+    assert mapped["race_current_category"] == "Sapphire"
+    assert mapped["power_w5"] == 880
+    assert mapped["race_max30_category"] == ""
+    assert mapped["race_max30_rating"] is None
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (880, 880),
+        (0, 0),
+        ("42", 42),
+        (72.9, 72),
+        (True, 1),
+        (None, None),
+        ("", None),
+        ("x", None),
+    ],
+)
+def test_parse_int(raw, expected) -> None:
+    from apps.zwiftracing.tasks import _parse_int
+
+    assert _parse_int(raw) == expected
+
+
+@pytest.mark.django_db
+def test_rating_history_is_newest_first_and_limited() -> None:
+    rider = ZRRider.objects.create(zwid=4001, name="Rider")
+    for rating in ("1500", "1510", "1520"):
+        rider.race_current_rating = Decimal(rating)
+        rider.save()
+
+    history = list(ZRRider.get_rating_history(4001, limit=2))
+    assert [rating for _, rating, _ in history] == [Decimal(1520), Decimal(1510)]
+    assert len(list(ZRRider.get_rating_history(4001, limit=None))) == 3
+
+
+def test_zr_client_shares_one_http_client(monkeypatch) -> None:
+    import httpx
+
+    from apps.zwiftracing import zr_client
+
+    assert zr_client._get_client() is zr_client._get_client()
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"riders": []})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(zr_client, "_get_client", lambda: client)
+    monkeypatch.setattr(zr_client, "_get_api_url", lambda: "https://zr.example/api/")
+    monkeypatch.setattr(zr_client, "_get_headers", lambda: {"Authorization": "key"})
+
+    assert zr_client.get_club(20650) == (200, {"riders": []})
+    assert zr_client.get_club(20650, 4598636)[0] == 200
+    assert [str(r.url) for r in seen] == [
+        "https://zr.example/api/clubs/20650/",
+        "https://zr.example/api/clubs/20650/4598636",
+    ]
+    assert seen[0].headers["Authorization"] == "key"
@@ -5,9 +5,15 @@ All methods return a tuple of (status_code, response_json).
 429 errors are returned without raising an exception to allow retry handling.
 """
 
+from functools import cache
+
 import httpx
 import logfire
 from constance import config
+from pydantic_core import from_json
+
+ZR_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+ZR_LIMITS = httpx.Limits(max_keepalive_connections=5)
 
 
 def _get_api_url() -> str:
@@ -20,6 +26,21 @@ def _get_api_url() -> str:
     return config.ZRAPP_API_URL
 
 
+@cache
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, created on first use.
+
+    Reusing one client keeps the connection to the API alive across calls
+    (e.g. paginated club syncs) instead of a new TCP+TLS handshake each time.
+    The URL and headers are still read from constance per request.
+
+    Returns:
+        The shared httpx Client.
+
+    """
+    return httpx.Client(timeout=ZR_TIMEOUT, limits=ZR_LIMITS)
+
+
 def _get_headers() -> dict[str, str]:
     """Get the API headers with authorization from constance config.
 
@@ -43,7 +64,7 @@ def _handle_response(response: httpx.Response, endpoint: str) -> tuple[int, dict
 
     """
     if response.status_code == 429:
-        data = response.json()
+        data = from_json(response.content)
         retry_after = data.get("retryAfter", "unknown")
         logfire.warning(
             "ZR API rate limited",
@@ -52,7 +73,9 @@ def _handle_response(response: httpx.Response, endpoint: str) -> tuple[int, dict
         )
         return response.status_code, data
     response.raise_for_status()
-    return response.status_code, response.json()
+    # Club pages run to several hundred KB of nested JSON; pydantic-core's
+    # Rust parser decodes the raw bytes much faster than stdlib json
+    return response.status_code, from_json(response.content)
 
 
 # CLUB ============================================================================================
@@ -72,7 +95,9 @@ def get_club(club_id: int, from_id: int | None = None) -> tuple[int, dict]:
     """
     endpoint = f"clubs/{club_id}"
     logfire.debug("ZR API request: get_club", club_id=club_id, from_id=from_id)
-    response = httpx.get(url=f"{_get_api_url()}clubs/{club_id}/{from_id if from_id else ''}", headers=_get_headers())
+    response = _get_client().get(
+        url=f"{_get_api_url()}clubs/{club_id}/{from_id if from_id else ''}", headers=_get_headers()
+    )
     return _handle_response(response, endpoint)
 
 
@@ -91,7 +116,7 @@ def get_event(event_id: int) -> tuple[int, dict]:
     """
     endpoint = f"results/{event_id}"
     logfire.debug("ZR API request: get_event", event_id=event_id)
-    response = httpx.get(url=f"{_get_api_url()}results/{event_id}", headers=_get_headers())
+    response = _get_client().get(url=f"{_get_api_url()}results/{event_id}", headers=_get_headers())
     return _handle_response(response, endpoint)
 
 
@@ -110,7 +135,7 @@ def get_zp_results(event_id: int) -> tuple[int, dict]:
     """
     endpoint = f"zp/{event_id}/results"
     logfire.debug("ZR API request: get_zp_results", event_id=event_id)
-    response = httpx.get(url=f"{_get_api_url()}zp/{event_id}/results", headers=_get_headers())
+    response = _get_client().get(url=f"{_get_api_url()}zp/{event_id}/results", headers=_get_headers())
     return _handle_response(response, endpoint)
 
 
@@ -131,7 +156,9 @@ def get_rider(rider_id: int, epoch: int | None = None) -> tuple[int, dict]:
     """
     endpoint = f"riders/{rider_id}"
     logfire.debug("ZR API request: get_rider", rider_id=rider_id, epoch=epoch)
-    response = httpx.get(url=f"{_get_api_url()}riders/{rider_id}/{epoch if epoch else ''}", headers=_get_headers())
+    response = _get_client().get(
+        url=f"{_get_api_url()}riders/{rider_id}/{epoch if epoch else ''}", headers=_get_headers()
+    )
     return _handle_response(response, endpoint)
 
 
@@ -151,7 +178,9 @@ def get_riders(ids: list[int], epoch: int | None = None) -> tuple[int, list | di
     """
     endpoint = "riders (batch)"
     logfire.debug("ZR API request: get_riders", rider_count=len(ids), epoch=epoch)
-    response = httpx.post(url=f"{_get_api_url()}riders/{epoch if epoch else ''}", headers=_get_headers(), json=ids)
+    response = _get_client().post(
+        url=f"{_get_api_url()}riders/{epoch if epoch else ''}", headers=_get_headers(), json=ids
+    )
     return _handle_response(response, endpoint)
 
 
@@ -1,5 +1,7 @@
 """Application configuration using pydantic-settings."""
 
+from functools import cached_property
+
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,7 +36,7 @@ class Settings(BaseSettings):
     )
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def allowed_hosts(self) -> list[str]:
         """Allowed hosts as a list.
 
@@ -45,7 +47,7 @@ class Settings(BaseSettings):
         return [h.strip() for h in self.allowed_hosts_str.split(",") if h.strip()]
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def internal_ips(self) -> list[str]:
         """Internal IPs as a list.
 
@@ -153,7 +155,7 @@ class Settings(BaseSettings):
     )
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def cors_allowed_origins(self) -> list[str]:
         """CORS allowed origins as a list.
 
@@ -0,0 +1,37 @@
+"""Tests for the /robots.txt endpoint."""
+
+import pytest
+from constance.test import override_config
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("disallow_all", "disallow_ai", "expected_start", "blocks_gptbot"),
+    [
+        (False, False, "User-agent: *\nAllow: /", False),
+        (True, False, "User-agent: *\nDisallow: /", False),
+        (False, True, "User-agent: GPTBot\nUser-agent: ChatGPT-User\n", True),
+    ],
+)
+def test_robots_txt_follows_config(client, disallow_all, disallow_ai, expected_start, blocks_gptbot):
+    with override_config(ROBOTS_DISALLOW_ALL=disallow_all, ROBOTS_DISALLOW_AI=disallow_ai):
+        response = client.get("/robots.txt")
+    assert response.status_code == 200
+    assert response["content-type"] == "text/plain"
+    body = response.content.decode()
+    assert body.startswith(expected_start)
+    assert ("User-agent: GPTBot" in body) is blocks_gptbot
+    if disallow_ai:
+        assert body.endswith("\nUser-agent: Omgilibot\nDisallow: /\n\nUser-agent: *\nAllow: /")
+
+
+@pytest.mark.django_db
+def test_robots_txt_revalidates_with_etag(client):
+    with override_config(ROBOTS_DISALLOW_ALL=False, ROBOTS_DISALLOW_AI=True):
+        etag = client.get("/robots.txt")["ETag"]
+        assert client.get("/robots.txt", headers={"if-none-match": etag}).status_code == 304
+    # A config change swaps the body, so the old validator no longer matches
+    with override_config(ROBOTS_DISALLOW_ALL=True):
+        response = client.get("/robots.txt", headers={"if-none-match": etag})
+    assert response.status_code == 200
+    assert response["ETag"] != etag
@@ -1,17 +1,20 @@
 """Views for GOTTA_BIKE_virtual_team_platform project."""
 
+import hashlib
+
 import logfire
-import markdown
 from constance import config
 from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views.decorators.http import require_GET
 
-from apps.cms.models import Page
+from apps.cms.models import MARKDOWN_SOURCE_FIELDS, Page
 
 # AI crawlers to block when ROBOTS_DISALLOW_AI is enabled
-AI_CRAWLERS = [
+AI_CRAWLERS = (
     "GPTBot",  # OpenAI
     "ChatGPT-User",  # OpenAI
     "CCBot",  # Common Crawl (used for AI training)
@@ -28,7 +31,24 @@ AI_CRAWLERS = [
     "Diffbot",  # Diffbot
     "ImagesiftBot",  # AI image training
     "Omgilibot",  # Webz.io AI
-]
+)
+
+# robots.txt only has three possible bodies, so they are built once at import
+ROBOTS_ALLOW_ALL = b"User-agent: *\nAllow: /"
+ROBOTS_DISALLOW_ALL = b"User-agent: *\nDisallow: /"
+# All AI crawlers share one group: several User-agent lines, one rule (RFC 9309)
+ROBOTS_DISALLOW_AI = "\n".join([
+    *(f"User-agent: {crawler}" for crawler in AI_CRAWLERS),
+    "Disallow: /",
+    "",
+    "User-agent: *",
+    "Allow: /",
+]).encode()
+# Strong validators for the three bodies, so repeat fetches get a 304
+ROBOTS_ETAGS = {
+    body: quote_etag(hashlib.md5(body, usedforsecurity=False).hexdigest())
+    for body in (ROBOTS_ALLOW_ALL, ROBOTS_DISALLOW_ALL, ROBOTS_DISALLOW_AI)
+}
 
 
 @require_GET
@@ -48,33 +68,18 @@ def home(request):
         Rendered home page template.
 
     """
-    # Determine which page slug to use based on authentication
-    if request.user.is_authenticated and config.HOME_PAGE_SLUG_AUTHENTICATED:
-        slug = config.HOME_PAGE_SLUG_AUTHENTICATED
-    else:
+    # Determine which page slug to use based on authentication. Each constance
+    # read is a backend lookup, so read every key at most once.
+    slug = config.HOME_PAGE_SLUG_AUTHENTICATED if request.user.is_authenticated else ""
+    if not slug:
         slug = config.HOME_PAGE_SLUG
 
     if slug:
-        try:
-            page = Page.objects.get(slug=slug, status=Page.Status.PUBLISHED)
-        except Page.DoesNotExist:
+        page = Page.objects.defer(*MARKDOWN_SOURCE_FIELDS).filter(slug=slug, status=Page.Status.PUBLISHED).first()
+        if page is None:
             logfire.warning("HOME_PAGE_SLUG configured but page not found or not published", slug=slug)
             return render(request, "index.html")
 
-        content_html = ""
-        if page.content:
-            content_html = markdown.markdown(
-                page.content,
-                extensions=["extra", "codehilite", "toc", "nl2br", "tables"],
-            )
-
-        hero_subtitle_html = ""
-        if page.hero_subtitle:
-            hero_subtitle_html = markdown.markdown(
-                page.hero_subtitle,
-                extensions=["nl2br"],
-            )
-
         logfire.info(
             "Home page served from CMS",
             slug=slug,
@@ -83,8 +88,7 @@ def home(request):
         )
         context = {
             "page": page,
-            "content_html": content_html,
-            "hero_subtitle_html": hero_subtitle_html,
+            **page.get_rendered_html(),
         }
         return render(request, "cms/page_detail.html", context)
 
@@ -140,39 +144,25 @@ def robots_txt(request):
         request: The HTTP request.
 
     Returns:
-        Plain text robots.txt response.
+        Plain text robots.txt response, or 304 Not Modified when the client's
+        If-None-Match already matches the current body.
 
     """
-    lines = []
-
     if config.ROBOTS_DISALLOW_ALL:
         # Block all crawlers
-        lines.extend([
-            "User-agent: *",
-            "Disallow: /",
-        ])
+        content = ROBOTS_DISALLOW_ALL
     elif config.ROBOTS_DISALLOW_AI:
-        # Block AI crawlers only
-        for crawler in AI_CRAWLERS:
-            lines.extend([
-                f"User-agent: {crawler}",
-                "Disallow: /",
-                "",
-            ])
-        # Allow other crawlers
-        lines.extend([
-            "User-agent: *",
-            "Allow: /",
-        ])
+        # Block AI crawlers only, allow other crawlers
+        content = ROBOTS_DISALLOW_AI
     else:
         # Allow all crawlers (default)
-        lines.extend([
-            "User-agent: *",
-            "Allow: /",
-        ])
-
-    content = "\n".join(lines)
-    return HttpResponse(content, content_type="text/plain")
+        content = ROBOTS_ALLOW_ALL
+    etag = ROBOTS_ETAGS[content]
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(content, content_type="text/plain")
+        response["ETag"] = etag
+    return response
 
 
 @require_GET
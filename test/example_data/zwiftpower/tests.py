@@ -1,7 +1,26 @@
 """Integration tests for ZPClient using real credentials from .env."""
 
+import pytest
+
 from apps.zwiftpower.zp_client import ZPClient
 
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module")
+def zp_client():
+    """Log in once and share the session across the data-fetching tests.
+
+    Tests that exercise the login/close lifecycle build their own client.
+
+    Yields:
+        A logged-in ZPClient, closed after the module's tests finish.
+
+    """
+    with ZPClient() as client:
+        client.login()
+        yield client
+
 
 class TestZPClientIntegration:
     """Integration tests that connect to the real ZwiftPower service."""
@@ -84,19 +103,26 @@ class TestZPClientIntegration:
         # Clean up
         client.close()
 
-    def test_fetch_team_riders(self):
+    def test_fetch_team_riders(self, zp_client):
         """Test fetching team riders returns list of team members."""
-        with ZPClient() as client:
-            roster = client.fetch_team_riders()
+        roster = zp_client.fetch_team_riders()
+
+        # Should return a list
+        assert isinstance(roster, list)
+
+        # Team should have members
+        assert len(roster) > 0
 
-            # Should return a list
-            assert isinstance(roster, list)
+        # Each member should have expected fields
+        member = roster[0]
+        assert "zwid" in member
+        assert "name" in member
+        assert "flag" in member
 
-            # Team should have members
-            assert len(roster) > 0
+    def test_fetch_team_results(self, zp_client):
+        """Test fetching team results reuses the shared logged-in session."""
+        results = zp_client.fetch_team_results()
 
-            # Each member should have expected fields
-            member = roster[0]
-            assert "zwid" in member
-            assert "name" in member
-            assert "flag" in member
+        assert isinstance(results, dict)
+        assert "events" in results
+        assert "data" in results